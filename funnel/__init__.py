@@ -102,6 +102,14 @@ app.config['FLATPAGES_MARKDOWN_EXTENSIONS'] = ['markdown.extensions.nl2br']
 app.config['FLATPAGES_EXTENSION'] = '.md'
 app.config['EXECUTOR_PROPAGATE_EXCEPTIONS'] = True
 app.config['EXECUTOR_PUSH_APP_CONTEXT'] = True
+# Raise SQLAlchemy's per-engine SQL compilation cache above the default of 500.
+# The polymorphic Account model expands into large statements and hot paths like
+# Account.get and autocomplete recompile if their entries get evicted
+_engine_options = app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {})
+_engine_options.setdefault('query_cache_size', 1000)
+# Psycopg converts a repeated query into a server-side prepared statement after
+# this many executions, skipping Postgres parse+plan on hot per-request lookups
+_engine_options.setdefault('connect_args', {}).setdefault('prepare_threshold', 1)
 # Remove legacy asset manifest settings that Baseframe looks for
 app.config.pop('ASSET_MANIFEST_PATH', None)
 app.config.pop('ASSET_BASE_PATH', None)
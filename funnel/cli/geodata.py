@@ -2,24 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import os
 import sys
 import time
 import zipfile
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, date, datetime
 from decimal import Decimal
+from functools import cache
 from http import HTTPStatus
+from operator import itemgetter
 from urllib.parse import urljoin
 
 import click
-import requests
+import httpx
 import rich.progress
 from flask.cli import AppGroup
+from sqlalchemy.dialects import postgresql
 from unidecode import unidecode
 
-from coaster.utils import getbool
+from coaster.utils import getbool, make_name
 
 from .. import app
 from ..models import (
@@ -29,10 +35,16 @@ from ..models import (
     GeoCountryInfo,
     GeoName,
     db,
+    sa,
 )
 
 ONE_DAY = 86400
 POPULATION_THRESHOLD = 15000
+COPY_BATCH_SIZE = 100000
+PROGRESS_INTERVAL = 10000
+ALTNAME_BATCH_SIZE = 10000
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+DOWNLOAD_CONCURRENCY = 3
 
 csv.field_size_limit(sys.maxsize)
 
@@ -99,21 +111,20 @@ class GeoAdminRecord:
     geonameid: str
 
 
-@dataclass
-class GeoAltNameRecord:
-    """Geonames alt name record."""
+def extract_zip(folder_file: str, folder: str | None) -> None:
+    """Extract a downloaded zip file into the download folder."""
+    with zipfile.ZipFile(folder_file, 'r') as zipf:
+        zipf.extractall(folder)
 
-    id: str
-    geonameid: str
-    lang: str
-    title: str
-    is_preferred_name: str
-    is_short_name: str
-    is_colloquial: str
-    is_historic: str
 
-
-def downloadfile(basepath: str, filename: str, folder: str | None = None) -> None:
+async def downloadfile(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    progress: rich.progress.Progress,
+    basepath: str,
+    filename: str,
+    folder: str | None = None,
+) -> None:
     """Download a geoname record file."""
     folder_file = filename if not folder else os.path.join(folder, filename)
     if (
@@ -122,6 +133,36 @@ def downloadfile(basepath: str, filename: str, folder: str | None = None) -> Non
     ):
         click.echo(f"Skipping re-download of recent {filename}")
         return
+    async with semaphore:
+        task = progress.add_task(f"Downloading {filename}", total=None)
+        url = urljoin(basepath, filename)
+        async with client.stream('GET', url, timeout=30) as r:
+            if r.status_code == HTTPStatus.OK:
+                filesize = int(r.headers.get('content-length', 0))
+                if filesize:
+                    progress.update(task, total=filesize)
+                # Disk writes are blocking; hand them to a worker thread so the
+                # event loop keeps the other semaphore-limited downloads moving
+                fd = await asyncio.to_thread(open, folder_file, 'wb')
+                try:
+                    async for chunk in r.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        await asyncio.to_thread(fd.write, chunk)
+                        progress.update(task, advance=len(chunk))
+                finally:
+                    await asyncio.to_thread(fd.close)
+
+    # Extract outside the semaphore, after the download is complete, in a worker
+    # thread as zip extraction is also blocking I/O
+    if filename.lower().endswith('.zip'):
+        await asyncio.to_thread(extract_zip, folder_file, folder)
+
+
+async def downloadfiles(
+    basepath: str, filenames: Sequence[str], folder: str | None = None
+) -> None:
+    """Download geoname record files concurrently."""
+    # geonames.org is sensitive to load; cap concurrent downloads
+    semaphore = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
     with rich.progress.Progress(
         rich.progress.TextColumn('{task.description}'),
         rich.progress.BarColumn(),
@@ -130,24 +171,54 @@ def downloadfile(basepath: str, filename: str, folder: str | None = None) -> Non
         rich.progress.TransferSpeedColumn(),
         rich.progress.TimeRemainingColumn(),
     ) as progress:
-        task = progress.add_task(f"Downloading {filename}", total=None)
-        url = urljoin(basepath, filename)
-        r = requests.get(url, stream=True, timeout=30)
-        if r.status_code == HTTPStatus.OK:
-            filesize = int(r.headers.get('content-length', 0))
-            if filesize:
-                progress.update(task, total=filesize)
-            with open(folder_file, 'wb') as fd:
-                for chunk in r.iter_content(1024):
-                    if not chunk:
-                        # Break when done. The connection remains open for Keep-Alive
-                        break
-                    fd.write(chunk)
-                    progress.update(task, advance=len(chunk))
-
-        if filename.lower().endswith('.zip'):
-            with zipfile.ZipFile(folder_file, 'r') as zipf:
-                zipf.extractall(folder)
+        # Share one client so all downloads reuse pooled keep-alive connections
+        async with httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=DOWNLOAD_CONCURRENCY,
+                max_keepalive_connections=DOWNLOAD_CONCURRENCY,
+            ),
+            transport=httpx.AsyncHTTPTransport(retries=3),
+        ) as client:
+            await asyncio.gather(
+                *(
+                    downloadfile(
+                        client, semaphore, progress, basepath, filename, folder
+                    )
+                    for filename in filenames
+                )
+            )
+
+
+def copy_escape(value: object) -> str:
+    """Render a value for PostgreSQL COPY text format."""
+    if value is None:
+        return r'\N'
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+def parse_coordinate(value: str) -> Decimal | None:
+    """Parse a latitude or longitude, distinguishing 0 (equator) from missing."""
+    return Decimal(value) if value else None
+
+
+def parse_moddate(moddate: str) -> date:
+    """Parse a fixed-format YYYY-MM-DD date without strptime's parser overhead."""
+    try:
+        return date(int(moddate[0:4]), int(moddate[5:7]), int(moddate[8:10]))
+    except ValueError:
+        return datetime.strptime(moddate, '%Y-%m-%d').date()
+
+
+@cache
+def make_ascii_title(title: str) -> str:
+    """ASCII-fold a title, memoized since titles repeat heavily in geonames data."""
+    return unidecode(title).replace('@', 'a')
 
 
 def load_country_info(filename: str) -> None:
@@ -199,37 +270,57 @@ def load_country_info(filename: str) -> None:
         db.session.commit()
 
 
+# Feature descriptions: http://download.geonames.org/export/dump/featureCodes_en.txt
+# Sorting order, larger number has more weight. Keys are packed as
+# `fclass + '\t' + fcode` to avoid a tuple allocation per row in the hot filter
+LOAD_FEATURES = {
+    'L\tCONT': 22,  # Continent
+    'A\tPCL': 21,  # Political entity (country)
+    'A\tPCLD': 20,  # Dependent political entity
+    'A\tPCLF': 19,  # Freely associated state
+    'A\tPCLI': 18,  # Independent political entity
+    'A\tPCLS': 17,  # Semi-independent political entity
+    'A\tADM1': 16,  # First-order administrative division (state, province)
+    'P\tPPLC': 15,  # capital of a political entity
+    'P\tPPLA': 14,  # Seat of a first-order admin. division (state capital)
+    'P\tPPLA2': 13,  # Seat of a second-order administrative division
+    'P\tPPLA3': 12,  # Seat of a third-order administrative division
+    'P\tPPLA4': 11,  # Seat of a fourth-order administrative division
+    'P\tPPLG': 10,  # Seat of government of a political entity
+    'P\tPPL': 9,  # Populated place (city, could be a neighbourhood too)
+    'P\tPPLR': 8,  # Religious populated place
+    'P\tPPLS': 7,  # Populated places
+    'P\tPPLX': 6,  # Section of populated place
+    'S\tTRIG': 5,  # Triangulated location (shows up in data instead of P.PPL)
+    'P\tPPLL': 4,  # Populated locality
+    'P\tPPLF': 3,  # Farm village
+    'A\tADM2': 2,  # Second-order administrative division (district, county)
+    'A\tADM3': 1,  # Third-order administrative division
+}
+
+
+def geoname_filter(fclass: str, fcode: str, population: str) -> tuple[int, int] | None:
+    """
+    Test a raw geonames row against the load criteria.
+
+    Returns the ``(weight, population)`` sort key components if the row should be
+    loaded, or ``None`` to skip it. Populated places below the population
+    threshold are skipped, but a population of 0 is kept as it indicates data
+    wasn't available.
+    """
+    pop = int(population) if population.isdigit() else None
+    if fclass == 'P' and (pop is None or 0 < pop < POPULATION_THRESHOLD):
+        return None
+    weight = LOAD_FEATURES.get(fclass + '\t' + fcode)
+    if weight is None:
+        return None
+    return weight, pop or 0
+
+
 def load_geonames(filename: str) -> None:
     """Load geonames matching fixed criteria from the given file descriptor."""
     geonames = []
 
-    # Feature descriptions: http://download.geonames.org/export/dump/featureCodes_en.txt
-    # Sorting order, larger number has more weight
-    loadfeatures = {
-        ('L', 'CONT'): 22,  # Continent
-        ('A', 'PCL'): 21,  # Political entity (country)
-        ('A', 'PCLD'): 20,  # Dependent political entity
-        ('A', 'PCLF'): 19,  # Freely associated state
-        ('A', 'PCLI'): 18,  # Independent political entity
-        ('A', 'PCLS'): 17,  # Semi-independent political entity
-        ('A', 'ADM1'): 16,  # First-order administrative division (state, province)
-        ('P', 'PPLC'): 15,  # capital of a political entity
-        ('P', 'PPLA'): 14,  # Seat of a first-order admin. division (state capital)
-        ('P', 'PPLA2'): 13,  # Seat of a second-order administrative division
-        ('P', 'PPLA3'): 12,  # Seat of a third-order administrative division
-        ('P', 'PPLA4'): 11,  # Seat of a fourth-order administrative division
-        ('P', 'PPLG'): 10,  # Seat of government of a political entity
-        ('P', 'PPL'): 9,  # Populated place (city, could be a neighbourhood too)
-        ('P', 'PPLR'): 8,  # Religious populated place
-        ('P', 'PPLS'): 7,  # Populated places
-        ('P', 'PPLX'): 6,  # Section of populated place
-        ('S', 'TRIG'): 5,  # Triangulated location (shows up in data instead of P.PPL)
-        ('P', 'PPLL'): 4,  # Populated locality
-        ('P', 'PPLF'): 3,  # Farm village
-        ('A', 'ADM2'): 2,  # Second-order administrative division (district, county)
-        ('A', 'ADM3'): 1,  # Third-order administrative division
-    }
-
     with rich.progress.open(
         filename,
         mode='rt',
@@ -237,88 +328,176 @@ def load_geonames(filename: str) -> None:
         encoding='utf-8',
         description=f"Loading geonames from {filename}...",
     ) as fd:
-        for line in fd:
-            if not line.startswith('#'):
-                rec = GeoNameRecord(*line.strip().split('\t'))
-                # Ignore places that have a population below 15,000, but keep places
-                # that have a population of 0, since that indicates data wasn't
-                # available
-                if rec.fclass == 'P' and (
-                    (
-                        rec.population.isdigit()
-                        and int(rec.population != 0)
-                        and int(rec.population) < POPULATION_THRESHOLD
-                    )
-                    or not rec.population.isdigit()
-                ):
-                    continue
-                if (rec.fclass, rec.fcode) not in loadfeatures:
-                    continue
-                geonames.append(rec)
+        for row in csv.reader(fd, delimiter='\t'):
+            if row[0].startswith('#'):
+                continue
+            # Filter on raw fields before paying for dataclass construction
+            sort_key = geoname_filter(row[6], row[7], row[14])
+            if sort_key is None:
+                continue
+            # Carry the already-parsed sort key alongside the record so the sort
+            # below doesn't re-parse population and geonameid per row
+            weight, pop = sort_key
+            geonameid = row[0]
+            geonames.append(
+                (
+                    weight,
+                    pop,
+                    int(geonameid) if geonameid.isdigit() else geonameid,
+                    GeoNameRecord(*row),
+                )
+            )
 
     click.echo(f"Sorting {len(geonames)} records...")
 
-    geonames = [
-        row[3]
-        for row in sorted(
-            (
-                (
-                    loadfeatures[(item.fclass, item.fcode)],
-                    int(item.population) if item.population else 0,
-                    int(item.geonameid) if item.geonameid.isdigit() else item.geonameid,
-                    item,
-                )
-                for item in geonames
-            ),
-            reverse=True,
+    geonames.sort(key=itemgetter(0, 1, 2), reverse=True)
+    geonames = [row[3] for row in geonames]
+
+    # Preload lookup tables once instead of hydrating ORM objects per row
+    existing_ids = {row[0] for row in db.session.execute(sa.select(GeoName.id))}
+    used_names = {row[0] for row in db.session.execute(sa.select(GeoName.name))}
+    admin1_ids = {
+        (row.country_id, row.admin1_code): row.id
+        for row in db.session.execute(
+            sa.select(
+                GeoAdmin1Code.id, GeoAdmin1Code.country_id, GeoAdmin1Code.admin1_code
+            )
         )
-    ]
-    GeoName.query.all()  # Load all data into session cache for faster lookup
-
-    for item in rich.progress.track(geonames):
-        if item.geonameid:
-            gn = db.session.get(GeoName, int(item.geonameid))
-            if gn is None:
-                gn = GeoName(geonameid=int(item.geonameid))
-                db.session.add(gn)
-
-            gn.title = item.title or ''
-            gn.ascii_title = item.ascii_title or unidecode(item.title or '').replace(
-                '@', 'a'
+    }
+    admin2_ids = {
+        (row.country_id, row.admin1_code, row.admin2_code): row.id
+        for row in db.session.execute(
+            sa.select(
+                GeoAdmin2Code.id,
+                GeoAdmin2Code.country_id,
+                GeoAdmin2Code.admin1_code,
+                GeoAdmin2Code.admin2_code,
             )
-            gn.latitude = Decimal(item.latitude) or None
-            gn.longitude = Decimal(item.longitude) or None
-            gn.fclass = item.fclass or None
-            gn.fcode = item.fcode or None
-            gn.country_id = item.country_id or None
-            gn.cc2 = item.cc2 or None
-            gn.admin1 = item.admin1 or None
-            gn.admin2 = item.admin2 or None
-            gn.admin3 = item.admin3 or None
-            gn.admin4 = item.admin4 or None
-            gn.admin1code = gn.admin1_ref
-            gn.admin2code = gn.admin2_ref
-            gn.population = int(item.population) if item.population else None
-            gn.elevation = int(item.elevation) if item.elevation else None
-            gn.dem = int(item.dem) if item.dem else None
-            gn.timezone = item.timezone or None
-            gn.moddate = (
-                datetime.strptime(item.moddate, '%Y-%m-%d').date()
-                if item.moddate
-                else None
+        )
+    }
+
+    records = []
+    now = datetime.now(UTC)
+    with rich.progress.Progress() as progress:
+        task = progress.add_task("Preparing geoname records...", total=len(geonames))
+        for counter, item in enumerate(geonames):
+            # Per-row progress updates are measurable at this row count; batch them
+            if counter % PROGRESS_INTERVAL == 0:
+                progress.update(task, completed=counter)
+            if not item.geonameid:
+                continue
+            geonameid = int(item.geonameid)
+            ascii_title = item.ascii_title or make_ascii_title(item.title or '')
+            if geonameid not in existing_ids and ascii_title:
+                # Disambiguate the slug against existing and staged names locally,
+                # so no flush or second naming pass is needed. Existing rows keep
+                # their name (excluded from the upsert's update set)
+                name = str(
+                    make_name(
+                        GeoName.get_use_title(ascii_title, item.fclass, item.fcode),
+                        maxlength=250,
+                        checkused=used_names.__contains__,
+                    )
+                )
+                used_names.add(name)
+            else:
+                name = str(geonameid)
+            country_id = item.country_id or None
+            admin1 = item.admin1 or None
+            admin2 = item.admin2 or None
+            records.append(
+                {
+                    'created_at': now,
+                    'updated_at': now,
+                    'id': geonameid,
+                    'name': name,
+                    'title': item.title or '',
+                    'ascii_title': ascii_title,
+                    'latitude': parse_coordinate(item.latitude),
+                    'longitude': parse_coordinate(item.longitude),
+                    'fclass': item.fclass or None,
+                    'fcode': item.fcode or None,
+                    'country': country_id,
+                    'cc2': item.cc2 or None,
+                    'admin1': admin1,
+                    'admin2': admin2,
+                    'admin3': item.admin3 or None,
+                    'admin4': item.admin4 or None,
+                    'admin1_id': admin1_ids.get((country_id, admin1)),
+                    'admin2_id': admin2_ids.get((country_id, admin1, admin2)),
+                    'population': int(item.population) if item.population else None,
+                    'elevation': int(item.elevation) if item.elevation else None,
+                    'dem': int(item.dem) if item.dem else None,
+                    'timezone': item.timezone or None,
+                    'moddate': parse_moddate(item.moddate) if item.moddate else None,
+                }
             )
 
-            gn.make_name()
-            # Required for future make_name() calls to work correctly
-            db.session.flush()
+    if not records:
+        click.echo(f"No geoname records to load from {filename}")
+        return
 
-    db.session.commit()
+    # COPY into an unlogged staging table, then upsert from it in one statement.
+    # COPY bypasses per-INSERT parse and WAL overhead and is the fastest ingest
+    # path PostgreSQL offers
+    table_name = GeoName.__table__.name
+    stage_name = f'{table_name}_stage'
+    columns = list(records[0].keys())
+    column_list = ', '.join(columns)
+    set_clause = ', '.join(
+        f'{name} = EXCLUDED.{name}'
+        for name in columns
+        if name not in ('id', 'name', 'created_at')
+    )
+    # The geoname models live on their own bind, not the default engine
+    raw_conn = db.engines['geoname'].raw_connection()
+    try:
+        with raw_conn.cursor() as cursor:
+            # A crashed earlier run may have left the stage table behind
+            cursor.execute(f'DROP TABLE IF EXISTS {stage_name}')
+            cursor.execute(f'CREATE UNLOGGED TABLE {stage_name} (LIKE {table_name})')
+            for start in rich.progress.track(
+                range(0, len(records), COPY_BATCH_SIZE),
+                description="Copying geoname records...",
+            ):
+                with cursor.copy(
+                    f'COPY {stage_name} ({column_list}) FROM STDIN'
+                ) as copy:
+                    for record in records[start : start + COPY_BATCH_SIZE]:
+                        copy.write(
+                            '\t'.join(copy_escape(record[name]) for name in columns)
+                            + '\n'
+                        )
+            cursor.execute(
+                f'INSERT INTO {table_name} ({column_list})'  # noqa: S608
+                f' SELECT {column_list} FROM {stage_name}'
+                f' ON CONFLICT (id) DO UPDATE SET {set_clause}'
+            )
+            cursor.execute(f'DROP TABLE {stage_name}')
+        raw_conn.commit()
+    finally:
+        raw_conn.close()
 
 
 def load_alt_names(filename: str) -> None:
     """Load alternative names for geonames from the given file descriptor."""
     click.echo("Retrieving all geoname records...")
     geonameids = {r[0] for r in db.session.query(GeoName.id).all()}
+
+    table = GeoAltName.__table__
+    upsert = postgresql.insert(table)
+    upsert = upsert.on_conflict_do_update(
+        index_elements=['id'],
+        set_={
+            column.name: upsert.excluded[column.name]
+            for column in table.columns
+            if column.name not in ('id', 'created_at')
+        },
+    )
+
+    # Stream the ~15M-row file in fixed-size batches instead of staging every
+    # record in memory; parse and upsert overlap and peak memory stays flat
+    batch: list[dict] = []
     with rich.progress.open(
         filename,
         mode='rt',
@@ -326,27 +505,26 @@ def load_alt_names(filename: str) -> None:
         encoding='utf-8',
         description="Loading alternate names...",
     ) as fd:
-        altnames = [
-            GeoAltNameRecord(*row)
-            for counter, row in enumerate(csv.reader(fd, delimiter='\t'))
-            if not row[0].startswith('#') and int(row[1]) in geonameids
-        ]
-
-    GeoAltName.query.all()  # Load all data into session cache for faster lookup
-
-    for item in rich.progress.track(altnames):
-        if item.geonameid:
-            rec = db.session.get(GeoAltName, int(item.id))
-            if rec is None:
-                rec = GeoAltName(id=int(item.id))
-                db.session.add(rec)
-            rec.geonameid = int(item.geonameid)
-            rec.lang = item.lang or None
-            rec.title = item.title
-            rec.is_preferred_name = getbool(item.is_preferred_name) or False
-            rec.is_short_name = getbool(item.is_short_name) or False
-            rec.is_colloquial = getbool(item.is_colloquial) or False
-            rec.is_historic = getbool(item.is_historic) or False
+        for row in csv.reader(fd, delimiter='\t'):
+            if row[0].startswith('#') or int(row[1]) not in geonameids:
+                continue
+            batch.append(
+                {
+                    'id': int(row[0]),
+                    'geonameid': int(row[1]),
+                    'lang': row[2] or None,
+                    'title': row[3],
+                    'is_preferred_name': getbool(row[4]) or False,
+                    'is_short_name': getbool(row[5]) or False,
+                    'is_colloquial': getbool(row[6]) or False,
+                    'is_historic': getbool(row[7]) or False,
+                }
+            )
+            if len(batch) >= ALTNAME_BATCH_SIZE:
+                db.session.execute(upsert, batch)
+                batch = []
+    if batch:
+        db.session.execute(upsert, batch)
 
     db.session.commit()
 
@@ -366,10 +544,11 @@ def load_admin1_codes(filename: str) -> None:
             if not row[0].startswith('#')
         ]
 
-    GeoAdmin1Code.query.all()  # Load all data into session cache for faster lookup
+    # Load all rows once and look them up locally instead of a query per row
+    existing = {rec.geonameid: rec for rec in GeoAdmin1Code.query.all()}
     for item in rich.progress.track(admincodes):
         if item.geonameid:
-            rec = db.session.get(GeoAdmin1Code, item.geonameid)
+            rec = existing.get(int(item.geonameid))
             if rec is None:
                 rec = GeoAdmin1Code(geonameid=int(item.geonameid))
                 db.session.add(rec)
@@ -395,10 +574,11 @@ def load_admin2_codes(filename: str) -> None:
             if not row[0].startswith('#')
         ]
 
-    GeoAdmin2Code.query.all()  # Load all data into session cache for faster lookup
+    # Load all rows once and look them up locally instead of a query per row
+    existing = {rec.geonameid: rec for rec in GeoAdmin2Code.query.all()}
     for item in rich.progress.track(admincodes):
         if item.geonameid:
-            rec = db.session.get(GeoAdmin2Code, item.geonameid)
+            rec = existing.get(int(item.geonameid))
             if rec is None:
                 rec = GeoAdmin2Code(geonameid=int(item.geonameid))
                 db.session.add(rec)
@@ -413,28 +593,89 @@ def load_admin2_codes(filename: str) -> None:
 def download() -> None:
     """Download geoname data."""
     os.makedirs('download/geonames', exist_ok=True)
-    for filename in (
-        'countryInfo.txt',
-        'admin1CodesASCII.txt',
-        'admin2Codes.txt',
-        'IN.zip',
-        'allCountries.zip',
-        'alternateNames.zip',
-    ):
-        downloadfile(
-            'http://download.geonames.org/export/dump/', filename, 'download/geonames'
+    asyncio.run(
+        downloadfiles(
+            'http://download.geonames.org/export/dump/',
+            (
+                'countryInfo.txt',
+                'admin1CodesASCII.txt',
+                'admin2Codes.txt',
+                'IN.zip',
+                'allCountries.zip',
+                'alternateNames.zip',
+            ),
+            'download/geonames',
         )
+    )
+
+
+#: Tables large enough to benefit from relaxed durability during a full reload
+BULK_TABLES = ('geo_name', 'geo_alt_name')
+
+
+def bulk_load_start() -> None:
+    """Relax durability and constraint triggers on the big geo tables."""
+    # These tables are on the 'geoname' bind; db.session.execute would route
+    # textual SQL to the default engine, where they don't exist
+    with db.engines['geoname'].begin() as connection:
+        for table in BULK_TABLES:
+            connection.execute(sa.text(f'ALTER TABLE {table} SET UNLOGGED'))
+            connection.execute(sa.text(f'ALTER TABLE {table} DISABLE TRIGGER ALL'))
+
+
+def bulk_load_finish() -> None:
+    """Restore durability and triggers, and refresh planner statistics."""
+    with db.engines['geoname'].begin() as connection:
+        for table in BULK_TABLES:
+            connection.execute(sa.text(f'ALTER TABLE {table} ENABLE TRIGGER ALL'))
+            connection.execute(sa.text(f'ALTER TABLE {table} SET LOGGED'))
+            connection.execute(sa.text(f'ANALYZE {table}'))
+
+
+def run_loader(loader: Callable[[str], None], filename: str) -> None:
+    """Run a loader in a worker process with its own app context and connections."""
+    with app.app_context():
+        # Database connections forked from the parent process cannot be shared;
+        # discard the inherited pools on every bind, not just the default engine
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+        loader(filename)
 
 
 @geo.command('process')
-def process() -> None:
+@click.option(
+    '--bulk',
+    is_flag=True,
+    default=False,
+    help="Make the big geo tables unlogged and disable their triggers during the"
+    " load (requires superuser; data loss on crash requires a re-run).",
+)
+def process(bulk: bool) -> None:
     """Process downloaded geonames data."""
-    load_country_info('download/geonames/countryInfo.txt')
-    load_admin1_codes('download/geonames/admin1CodesASCII.txt')
-    load_admin2_codes('download/geonames/admin2Codes.txt')
-    load_geonames('download/geonames/IN.txt')
-    load_geonames('download/geonames/allCountries.txt')
-    load_alt_names('download/geonames/alternateNames.txt')
+    if bulk:
+        bulk_load_start()
+    try:
+        # The admin code tables have foreign keys to country info, so countries
+        # must load first. The two admin code files are independent of each other;
+        # load them concurrently in worker processes, each writing to its own table
+        load_country_info('download/geonames/countryInfo.txt')
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(run_loader, loader, filename)
+                for loader, filename in (
+                    (load_admin1_codes, 'download/geonames/admin1CodesASCII.txt'),
+                    (load_admin2_codes, 'download/geonames/admin2Codes.txt'),
+                )
+            ]
+            for future in futures:
+                future.result()
+        # Geonames need the admin codes loaded above, and alt names need geonames
+        load_geonames('download/geonames/IN.txt')
+        load_geonames('download/geonames/allCountries.txt')
+        load_alt_names('download/geonames/alternateNames.txt')
+    finally:
+        if bulk:
+            bulk_load_finish()
 
 
 app.cli.add_command(geo)
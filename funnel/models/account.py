@@ -73,7 +73,6 @@ from .helpers import (
     RESERVED_NAMES,
     ImgeeType,
     MarkdownCompositeDocument,
-    add_search_trigger,
     quote_autocomplete_like,
     quote_autocomplete_tsquery,
     valid_account_name,
@@ -103,6 +102,13 @@ __all__ = [
 ]
 
 
+#: Single-pass normalization table for account name lookups: lowercase ASCII and
+#: fold hyphens to underscores. Account names are ASCII-only (`valid_account_name`)
+_name_normalize_table = str.maketrans(
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ-', 'abcdefghijklmnopqrstuvwxyz_'
+)
+
+
 class AccountNameProblem(Enum):
     BLANK = 'blank'  # Name is blank
     RESERVED = 'reserved'  # Name is a reserved keyword
@@ -203,7 +209,7 @@ class Account(UuidMixin, BaseMixin[int, 'Account'], Model):
     is_community_profile: ClassVar[bool] = False
     is_placeholder_profile: ClassVar[bool] = False
 
-    reserved_names: ClassVar[set[str]] = RESERVED_NAMES
+    reserved_names: ClassVar[frozenset[str]] = RESERVED_NAMES
 
     type_: Mapped[str] = sa_orm.mapped_column('type', sa.CHAR(1), nullable=False)
 
@@ -344,6 +350,14 @@ class Account(UuidMixin, BaseMixin[int, 'Account'], Model):
                 Account.description_html,
             ),
         ),
+        sa.Computed(
+            "setweight(to_tsvector('english', COALESCE(title, '')), 'A')"
+            " || setweight(to_tsvector('english', COALESCE(name, '')), 'A')"
+            " || setweight(to_tsvector('english', COALESCE(tagline, '')), 'B')"
+            " || setweight(to_tsvector('english', COALESCE(description_text, '')),"
+            " 'B')",
+            persisted=True,
+        ),
         nullable=False,
         deferred=True,
     )
@@ -355,6 +369,11 @@ class Account(UuidMixin, BaseMixin[int, 'Account'], Model):
             regconfig='simple',
             hltext=lambda: sa.func.concat_ws(' @', Account.title, Account.name),
         ),
+        sa.Computed(
+            "to_tsvector('simple', COALESCE(title, ''))"
+            " || to_tsvector('simple', COALESCE(name, ''))",
+            persisted=True,
+        ),
         nullable=False,
         deferred=True,
     )
@@ -569,8 +588,8 @@ class Account(UuidMixin, BaseMixin[int, 'Account'], Model):
     )
 
     # comment.py
-    comments: DynamicMapped[Comment] = relationship(
-        lazy='dynamic', back_populates='_posted_by'
+    comments: sa_orm.WriteOnlyMapped[Comment] = relationship(
+        lazy='write_only', back_populates='_posted_by'
     )
     # commentset_membership.py
     active_commentset_memberships: DynamicMapped[CommentsetMembership] = relationship(
@@ -973,12 +992,24 @@ class Account(UuidMixin, BaseMixin[int, 'Account'], Model):
             sa.func.lower(name).label('name_lower'),
             unique=True,
             postgresql_ops={'name_lower': 'varchar_pattern_ops'},
+            # Covering the type discriminator makes the name-availability check an
+            # index-only scan (it selects nothing but `type`)
+            postgresql_include=['type'],
         ),
         sa.Index(
             'ix_account_title_lower',
             sa.func.lower(title).label('title_lower'),
             postgresql_ops={'title_lower': 'varchar_pattern_ops'},
         ),
+        # Partial index for name prefix matches in autocomplete, which filters on
+        # active accounts only; smaller and hotter in cache than the unique
+        # all-rows index above. The state value is ACCOUNT_STATE.ACTIVE
+        sa.Index(
+            'ix_account_name_lower_active',
+            sa.func.lower(name).label('name_lower_active'),
+            postgresql_ops={'name_lower_active': 'varchar_pattern_ops'},
+            postgresql_where=sa.text('state = 1'),
+        ),
         sa.Index('ix_account_search_vector', 'search_vector', postgresql_using='gin'),
         sa.Index('ix_account_name_vector', 'name_vector', postgresql_using='gin'),
     )
@@ -1074,6 +1105,10 @@ class Account(UuidMixin, BaseMixin[int, 'Account'], Model):
             defer(cls.pw_set_at),
             defer(cls.pw_expires_at),
             defer(cls.timezone),
+            # The markdown description columns can be kilobytes per row and are
+            # only rendered on profile detail pages, which don't defer
+            defer(cls.description_text),
+            defer(cls.description_html),
         ]
 
     @classmethod
@@ -1563,7 +1598,11 @@ class Account(UuidMixin, BaseMixin[int, 'Account'], Model):
 
     def is_safe_to_delete(self) -> bool:
         """Test if account is not protected and has no projects."""
-        return self.is_protected is False and self.projects.count() == 0
+        # Use EXISTS instead of counting: Postgres stops at the first matching row
+        return (
+            self.is_protected is False
+            and not db.session.query(self.projects.exists()).scalar()
+        )
 
     def is_safe_to_purge(self) -> bool:
         """Test if account is safe to delete and has no memberships (active or not)."""
@@ -1602,21 +1641,22 @@ class Account(UuidMixin, BaseMixin[int, 'Account'], Model):
         """Generate query filter to check if name is matching (case insensitive)."""
         if name.startswith('~'):
             return cls.uuid_zbase32 == name[1:]
-        return sa.func.lower(cls.name) == sa.func.lower(sa.func.replace(name, '-', '_'))
+        # Normalize the parameter client-side so the comparison is against a plain
+        # bound constant, matching the lower(name) functional index directly
+        return sa.func.lower(cls.name) == name.translate(_name_normalize_table)
 
     @classmethod
     def name_in(cls, names: Iterable[str]) -> ColumnElement:
         """Generate query filter to check if name is among candidates."""
         return sa.func.lower(cls.name).in_(
-            [name.lower().replace('-', '_') for name in names]
+            [name.translate(_name_normalize_table) for name in names]
         )
 
     @classmethod
     def name_like(cls, like_query: str) -> ColumnElement:
         """Generate query filter for a LIKE query on name."""
-        return sa.func.lower(cls.name).like(
-            sa.func.lower(sa.func.replace(like_query, '-', r'\_'))
-        )
+        # Lowercase client-side; '-' folds to an escaped '_' as this is a LIKE pattern
+        return sa.func.lower(cls.name).like(like_query.lower().replace('-', r'\_'))
 
     @overload
     @classmethod
@@ -1719,7 +1759,10 @@ class Account(UuidMixin, BaseMixin[int, 'Account'], Model):
     @classmethod
     def all_public(cls) -> Query:
         """Construct a query filtered by public profile state."""
-        query = cls.query.filter(cls.profile_state.PUBLIC)
+        # Callers (sitemap) read urls and timestamps only; skip the description
+        query = cls.query.filter(cls.profile_state.PUBLIC).options(
+            sa_orm.defer(cls.description_text), sa_orm.defer(cls.description_html)
+        )
         if cls is not Account:
             query = query.filter(cls.type_filter())
         return query
@@ -1738,6 +1781,10 @@ class Account(UuidMixin, BaseMixin[int, 'Account'], Model):
             return []
         tsquery = quote_autocomplete_tsquery(prefix)
 
+        # Results are rendered from columns alone; a relationship access here
+        # would be an N+1 bug, so raise instead of lazy-loading
+        defercols = [*cls._defercols(), sa_orm.raiseload('*')]
+
         # base_users is used in two of the three possible queries below
         base_users = cls.query.filter(
             cls.state.ACTIVE,
@@ -1746,9 +1793,7 @@ class Account(UuidMixin, BaseMixin[int, 'Account'], Model):
 
         if cls is not Account:
             base_users = base_users.filter(cls.type_filter())
-        base_users = (
-            base_users.options(*cls._defercols()).order_by(Account.title).limit(20)
-        )
+        base_users = base_users.options(*defercols).order_by(Account.title).limit(20)
 
         if (
             prefix != '@'
@@ -1763,7 +1808,10 @@ class Account(UuidMixin, BaseMixin[int, 'Account'], Model):
                     cls.state.ACTIVE,
                     cls.name_like(like_query[1:]),
                 )
-                .options(*cls._defercols())
+                .options(*defercols)
+                # Order on the same expression as the lowercase name index, so
+                # Postgres can walk the index in order and stop at the limit
+                .order_by(sa.func.lower(cls.name))
                 .limit(20)
                 # FIXME: Still broken as of SQLAlchemy 1.4.23 (also see next block)
                 # .union(
@@ -1800,7 +1848,7 @@ class Account(UuidMixin, BaseMixin[int, 'Account'], Model):
                     cls.query.join(AccountEmail)
                     .join(EmailAddress)
                     .filter(email_filter, cls.state.ACTIVE)
-                    .options(*cls._defercols())
+                    .options(*defercols)
                     .limit(20)
                     # .union(base_users)  # FIXME: Broken in SQLAlchemy 1.4.17
                     .all()
@@ -1833,18 +1881,19 @@ class Account(UuidMixin, BaseMixin[int, 'Account'], Model):
             return AccountNameProblem.LONG
         # Look for existing on the base Account model, not the subclass, as SQLAlchemy
         # will add a filter condition on subclasses to restrict the query to that type.
-        existing = (
-            Account.query.filter(Account.name_is(name))
-            .options(sa_orm.load_only(cls.id, cls.uuid, cls.type_))
-            .one_or_none()
+        # Select only the type discriminator: this is a per-keystroke availability
+        # check, and a bare column scalar skips polymorphic instance construction
+        existing_type = db.session.scalar(
+            sa.select(Account.type_).where(Account.name_is(name))
         )
-        if existing is not None:
-            match existing:
-                case User():
+        if existing_type is not None:
+            # Type letters are the subclasses' polymorphic identities
+            match existing_type:
+                case 'U':
                     return AccountNameProblem.USER
-                case Organization():
+                case 'O':
                     return AccountNameProblem.ORG
-                case Placeholder():
+                case 'P':
                     return AccountNameProblem.PLACEHOLDER
                 case _:
                     return AccountNameProblem.ACCOUNT
@@ -1965,8 +2014,6 @@ Account.__noninvite_membership_attrs__.update(
 
 auto_init_default(Account._state)  # pylint: disable=protected-access
 auto_init_default(Account._profile_state)  # pylint: disable=protected-access
-add_search_trigger(Account, 'search_vector')
-add_search_trigger(Account, 'name_vector')
 
 
 class AccountOldId(UuidMixin, BaseMixin[UUID, Account], Model):
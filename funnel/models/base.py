@@ -14,7 +14,6 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.ext.hybrid import hybrid_method, hybrid_property
 from sqlalchemy.orm import DeclarativeBase, Mapped, declarative_mixin, declared_attr
-from sqlalchemy_utils import LocaleType, TimezoneType, TSVectorType
 
 from coaster.sqlalchemy import (
     AppenderQuery,
@@ -42,6 +41,21 @@ from coaster.sqlalchemy import (
 
 if TYPE_CHECKING:
     from _typeshed.dbapi import DBAPIConnection
+    from sqlalchemy_utils import LocaleType, TimezoneType, TSVectorType
+
+#: Column types re-exported from sqlalchemy_utils, imported on first use since
+#: sqlalchemy_utils pulls in a large dependency tree (babel, arrow, phonenumbers)
+_SQLALCHEMY_UTILS_TYPES = ('LocaleType', 'TimezoneType', 'TSVectorType')
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SQLALCHEMY_UTILS_TYPES:
+        import sqlalchemy_utils
+
+        value = getattr(sqlalchemy_utils, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Model(AsyncAttrs, ModelBase, DeclarativeBase):
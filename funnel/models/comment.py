@@ -38,7 +38,7 @@ from .base import (
     sa,
     sa_orm,
 )
-from .helpers import MarkdownCompositeBasic, MessageComposite, add_search_trigger
+from .helpers import MarkdownCompositeBasic, MessageComposite
 
 __all__ = ['Comment', 'Commentset']
 
@@ -80,9 +80,46 @@ class SET_TYPE:  # noqa: N801
     UPDATE = 4
 
 
+#: Table names for known :class:`SET_TYPE` parents, for :attr:`Commentset.parent_type`
+SET_TYPE_TABLENAMES = {
+    SET_TYPE.PROJECT: 'project',
+    SET_TYPE.PROPOSAL: 'proposal',
+    SET_TYPE.UPDATE: 'update',
+}
+
 message_deleted = MessageComposite(__("[deleted]"), 'del')
 message_removed = MessageComposite(__("[removed]"), 'del')
 
+#: Bit flags for :attr:`Comment.badges`
+_BADGE_IS_SUBMITTER = 1
+_BADGE_IS_EDITOR = 2
+_BADGE_IS_PROMOTER = 4
+
+_badge_submitter = __("Submitter")
+_badge_editor = __("Editor")
+_badge_promoter = __("Promoter")
+_badge_editor_promoter = __("Editor & Promoter")
+
+#: Badge label sets for every combination of the flags above, precomputed so
+#: :attr:`Comment.badges` only builds a bitmask per call. The labels are lazy
+#: strings that resolve against the request locale when rendered. Frozen, as
+#: the same set is shared by every comment with the same flags
+_BADGE_TABLE: dict[int, frozenset[str]] = {
+    mask: frozenset(
+        ({_badge_submitter} if mask & _BADGE_IS_SUBMITTER else set())
+        | (
+            {_badge_editor_promoter}
+            if mask & _BADGE_IS_EDITOR and mask & _BADGE_IS_PROMOTER
+            else {_badge_editor}
+            if mask & _BADGE_IS_EDITOR
+            else {_badge_promoter}
+            if mask & _BADGE_IS_PROMOTER
+            else set()
+        )
+    )
+    for mask in range(8)
+}
+
 
 # MARK: Models -------------------------------------------------------------------------
 
@@ -122,8 +159,10 @@ class Commentset(UuidMixin, BaseMixin[int, Account], Model):
         datasets={'primary'},
     )
 
-    comments: DynamicMapped[Comment] = relationship(
-        lazy='dynamic',
+    # `write_only` supports large collections without materializing them, and unlike
+    # `dynamic` does not block batch loader strategies on the other side
+    comments: sa_orm.WriteOnlyMapped[Comment] = relationship(
+        lazy='write_only',
         cascade='save-update, merge, delete, delete-orphan',
         back_populates='commentset',
     )
@@ -183,6 +222,15 @@ class Commentset(UuidMixin, BaseMixin[int, Account], Model):
         super().__init__(**kwargs)
         self.count = 0
 
+    @classmethod
+    def parent_options(cls) -> tuple[sa_orm.Load, ...]:
+        """Return loader options to eager-load all possible parents in list queries."""
+        return (
+            sa_orm.selectinload(cls.project),
+            sa_orm.selectinload(cls.proposal),
+            sa_orm.selectinload(cls.update),
+        )
+
     @cached_property
     def parent(self) -> Project | Proposal | Update:
         # TODO: Move this to a CommentMixin that uses a registry, like EmailAddress
@@ -198,17 +246,25 @@ class Commentset(UuidMixin, BaseMixin[int, Account], Model):
 
     @cached_property
     def parent_type(self) -> str:
+        # Use the stored type when present to avoid loading the parent object
+        if self.settype is not None and self.settype in SET_TYPE_TABLENAMES:
+            return SET_TYPE_TABLENAMES[self.settype]
         return self.parent.__tablename__
 
     with_roles(parent_type, read={'all'})
 
+    if TYPE_CHECKING:
+        # The implementation is after the Comment class as it refers to Comment
+        last_comment_id: Mapped[int | None]
+
     @cached_property
     def last_comment(self) -> Comment | None:
-        return (
-            self.comments.filter(Comment.state.PUBLIC)
-            .order_by(Comment.created_at.desc())
-            .first()
-        )
+        # The deferred :attr:`last_comment_id` column property batches into list
+        # queries via undefer, unlike the ORDER BY query it replaces
+        comment_id = self.last_comment_id
+        if comment_id is None:
+            return None
+        return db.session.get(Comment, comment_id)
 
     with_roles(last_comment, read={'all'}, datasets={'primary'})
 
@@ -248,19 +304,27 @@ class Commentset(UuidMixin, BaseMixin[int, Account], Model):
 
     # Transitions for the other two states are pending on the TODO notes in post_comment
 
+    def _active_subscription(self, member: Account) -> CommentsetMembership | None:
+        """Return the member's active subscription, memoized on this instance."""
+        try:
+            cache = self._subscription_cache
+        except AttributeError:
+            cache = self._subscription_cache = {}
+        if member not in cache:
+            cache[member] = CommentsetMembership.query.filter_by(
+                commentset=self, member=member, is_active=True
+            ).one_or_none()
+        return cache[member]
+
     def update_last_seen_at(self, member: Account) -> None:
-        subscription = CommentsetMembership.query.filter_by(
-            commentset=self, member=member, is_active=True
-        ).one_or_none()
+        subscription = self._active_subscription(member)
         if subscription is not None:
             subscription.update_last_seen_at()
 
     def add_subscriber(self, actor: Account, member: Account) -> bool:
         """Return True is subscriber is added or unmuted, False if already exists."""
         changed = False
-        subscription = CommentsetMembership.query.filter_by(
-            commentset=self, member=member, is_active=True
-        ).one_or_none()
+        subscription = self._active_subscription(member)
         if subscription is None:
             subscription = CommentsetMembership(
                 commentset=self,
@@ -272,36 +336,36 @@ class Commentset(UuidMixin, BaseMixin[int, Account], Model):
         elif subscription.is_muted:
             subscription = subscription.replace(actor=actor, is_muted=False)
             changed = True
+        self._subscription_cache[member] = subscription
         subscription.update_last_seen_at()
         return changed
 
     def mute_subscriber(self, actor: Account, member: Account) -> bool:
         """Return True if subscriber was muted, False if already muted or missing."""
-        subscription = CommentsetMembership.query.filter_by(
-            commentset=self, member=member, is_active=True
-        ).one_or_none()
+        subscription = self._active_subscription(member)
         if subscription is not None and not subscription.is_muted:
-            subscription.replace(actor=actor, is_muted=True)
+            self._subscription_cache[member] = subscription.replace(
+                actor=actor, is_muted=True
+            )
             return True
         return False
 
     def unmute_subscriber(self, actor: Account, member: Account) -> bool:
         """Return True if subscriber was unmuted, False if not muted or missing."""
-        subscription = CommentsetMembership.query.filter_by(
-            commentset=self, member=member, is_active=True
-        ).one_or_none()
+        subscription = self._active_subscription(member)
         if subscription is not None and subscription.is_muted:
-            subscription.replace(actor=actor, is_muted=False)
+            self._subscription_cache[member] = subscription.replace(
+                actor=actor, is_muted=False
+            )
             return True
         return False
 
     def remove_subscriber(self, actor: Account, member: Account) -> bool:
         """Return True is subscriber is removed, False if already removed."""
-        subscription = CommentsetMembership.query.filter_by(
-            commentset=self, member=member, is_active=True
-        ).one_or_none()
+        subscription = self._active_subscription(member)
         if subscription is not None:
             subscription.revoke(actor=actor)
+            self._subscription_cache[member] = None
             return True
         return False
 
@@ -331,6 +395,19 @@ class Comment(UuidMixin, BaseMixin[int, Account], Model):
         back_populates='replies', remote_side='Comment.id'
     )
     replies: Mapped[list[Comment]] = relationship(back_populates='in_reply_to')
+    #: Public replies only, filtered in the database rather than in Python, and
+    #: batch-loaded with a single IN query when parent comments are listed. In a
+    #: self-referential join every column needs an explicit :func:`~sa_orm.remote`
+    #: annotation, or the state criterion binds to the parent comment instead of
+    #: the replies. The state test mirrors :attr:`state.PUBLIC`
+    public_replies: Mapped[list[Comment]] = relationship(
+        primaryjoin=lambda: sa.and_(
+            sa_orm.remote(sa_orm.foreign(Comment.in_reply_to_id)) == Comment.id,
+            sa_orm.remote(Comment._state).in_(COMMENT_STATE.PUBLIC),
+        ),
+        lazy='selectin',
+        viewonly=True,
+    )
 
     _message, message_text, message_html = MarkdownCompositeBasic.create(
         'message', nullable=False
@@ -355,8 +432,11 @@ class Comment(UuidMixin, BaseMixin[int, Account], Model):
         datasets={'primary', 'related', 'json'},
     )
 
-    #: Revision number maintained by SQLAlchemy, starting at 1
-    revisionid: Mapped[int] = with_roles(sa_orm.mapped_column(), read={'all'})
+    #: Revision number maintained by SQLAlchemy, starting at 1. Deferred as list
+    #: queries never use it; the update path fetches it on demand before flush
+    revisionid: Mapped[int] = with_roles(
+        sa_orm.mapped_column(deferred=True), read={'all'}
+    )
 
     search_vector: Mapped[str] = sa_orm.mapped_column(
         TSVectorType(
@@ -365,8 +445,13 @@ class Comment(UuidMixin, BaseMixin[int, Account], Model):
             regconfig='english',
             hltext=lambda: Comment.message_html,
         ),
+        sa.Computed(
+            "setweight(to_tsvector('english', COALESCE(message_text, '')), 'A')",
+            persisted=True,
+        ),
         nullable=False,
         deferred=True,
+        deferred_group='search',
     )
 
     moderator_reports: DynamicMapped[CommentModeratorReport] = relationship(
@@ -375,6 +460,15 @@ class Comment(UuidMixin, BaseMixin[int, Account], Model):
 
     __table_args__ = (
         sa.Index('ix_comment_search_vector', 'search_vector', postgresql_using='gin'),
+        # Partial index for queries that count or list public comments per
+        # commentset, such as CommentsetMembership.new_comment_count. The state
+        # values are SUBMITTED and VERIFIED (COMMENT_STATE.PUBLIC)
+        sa.Index(
+            'ix_comment_commentset_public_created',
+            'commentset_id',
+            'created_at',
+            postgresql_where=sa.text('state IN (1, 6)'),
+        ),
     )
 
     __mapper_args__ = {'version_id_col': revisionid}
@@ -399,16 +493,42 @@ class Comment(UuidMixin, BaseMixin[int, Account], Model):
         super().__init__(**kwargs)
         self.commentset.last_comment_at = sa.func.utcnow()
 
-    @cached_property
-    def has_replies(self) -> bool:
-        return bool(self.replies)
+    if TYPE_CHECKING:
+        # The implementation is after the class definition as it must refer to an
+        # alias of this class
+        has_replies: Mapped[bool]
+
+    @classmethod
+    def list_options(cls) -> tuple[sa_orm.interfaces.ORMOption, ...]:
+        """
+        Return loader options for views that render a list of comments.
+
+        Restricts the SELECT to the columns those views use and batch-loads
+        posters, so deleted and spam comments (which render a placeholder
+        account) never trigger a lazy load per row.
+        """
+        return (
+            sa_orm.load_only(
+                cls.uuid,
+                cls.created_at,
+                cls.edited_at,
+                cls._state,
+                cls.posted_by_id,
+                cls.commentset_id,
+                cls.in_reply_to_id,
+                cls.message_text,
+                cls.message_html,
+            ),
+            # List views test this deferred flag on every comment
+            sa_orm.undefer(cls.has_replies),
+            sa_orm.selectinload(cls._posted_by),
+        )
 
     @property
     def current_access_replies(self) -> list[RoleAccessProxy]:
         return [
             reply.current_access(datasets=('json', 'related'))
-            for reply in self.replies
-            if reply.state.PUBLIC
+            for reply in self.public_replies
         ]
 
     with_roles(current_access_replies, read={'all'}, datasets={'related', 'json'})
@@ -472,34 +592,58 @@ class Comment(UuidMixin, BaseMixin[int, Account], Model):
     @property
     def title(self) -> str:
         """A made-up title referring to the context for the comment."""
-        obj = self.commentset.parent
+        # The same (poster, parent) pair recurs across a thread, and comments in a
+        # thread share the commentset instance via the identity map, so memoize the
+        # formatted title there (as :attr:`badges` does) to skip repeated Babel
+        # lookups and parent title loads
+        commentset = self.commentset
+        posted_by = self.posted_by
+        try:
+            cache = commentset._title_cache
+        except AttributeError:
+            cache = commentset._title_cache = {}
+        if posted_by in cache:
+            return cache[posted_by]
+        obj = commentset.parent
         if obj is not None:
-            return _("{user} commented on {obj}").format(
-                user=self.posted_by.pickername, obj=obj.title
+            title = _("{user} commented on {obj}").format(
+                user=posted_by.pickername, obj=obj.title
             )
-        return _("{account} commented").format(  # type: ignore[unreachable]
-            account=self.posted_by.pickername
-        )
+        else:
+            title = _("{account} commented").format(  # type: ignore[unreachable]
+                account=posted_by.pickername
+            )
+        cache[posted_by] = title
+        return title
 
     with_roles(title, read={'all'}, datasets={'primary', 'related', 'json'})
 
     @property
-    def badges(self) -> set[str]:
-        badges = set()
+    def badges(self) -> frozenset[str]:
+        # Badges depend only on (commentset, poster). Comments in a thread share the
+        # commentset instance via the identity map, so memoize there to avoid
+        # re-resolving roles per comment for the same author
+        commentset = self.commentset
+        try:
+            cache = commentset._badges_cache
+        except AttributeError:
+            cache = commentset._badges_cache = {}
+        if self._posted_by in cache:
+            return cache[self._posted_by]
+        mask = 0
         roles: set[str] | LazyRoleSet = set()
-        if self.commentset.project is not None:
-            roles = self.commentset.project.roles_for(self._posted_by)
-        elif self.commentset.proposal is not None:
-            roles = self.commentset.proposal.project.roles_for(self._posted_by)
-            if 'submitter' in self.commentset.proposal.roles_for(self._posted_by):
-                badges.add(_("Submitter"))
+        if commentset.project is not None:
+            roles = commentset.project.roles_for(self._posted_by)
+        elif commentset.proposal is not None:
+            roles = commentset.proposal.project.roles_for(self._posted_by)
+            if 'submitter' in commentset.proposal.roles_for(self._posted_by):
+                mask |= _BADGE_IS_SUBMITTER
         if 'editor' in roles:
-            if 'promoter' in roles:
-                badges.add(_("Editor & Promoter"))
-            else:
-                badges.add(_("Editor"))
-        elif 'promoter' in roles:
-            badges.add(_("Promoter"))
+            mask |= _BADGE_IS_EDITOR
+        if 'promoter' in roles:
+            mask |= _BADGE_IS_PROMOTER
+        badges = _BADGE_TABLE[mask]
+        cache[self._posted_by] = badges
         return badges
 
     with_roles(badges, read={'all'}, datasets={'related', 'json'})
@@ -543,7 +687,23 @@ class Comment(UuidMixin, BaseMixin[int, Account], Model):
         return True
 
 
-add_search_trigger(Comment, 'search_vector')
+# An EXISTS check beats loading the full replies collection just to test emptiness.
+# Deferred by default; list views that render the flag should undefer it
+_comment_reply = sa_orm.aliased(Comment)
+Comment.has_replies = sa_orm.column_property(
+    sa.exists().where(_comment_reply.in_reply_to_id == Comment.id), deferred=True
+)
+
+Commentset.last_comment_id = sa_orm.column_property(
+    sa.select(Comment.id)
+    .where(Comment.commentset_id == Commentset.id)
+    .where(Comment.state.PUBLIC)  # type: ignore[has-type]  # FIXME
+    .order_by(Comment.created_at.desc())
+    .limit(1)
+    .correlate_except(Comment)
+    .scalar_subquery(),
+    deferred=True,
+)
 
 
 # Tail imports for type checking
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Self
 from werkzeug.utils import cached_property
 
 from .account import Account
-from .base import Mapped, Model, Query, relationship, sa, sa_orm
+from .base import Mapped, Model, Query, db, relationship, sa, sa_orm
 from .membership_mixin import ImmutableMembershipMixin
 
 __all__ = ['CommentsetMembership']
@@ -68,7 +68,7 @@ class CommentsetMembership(ImmutableMembershipMixin, Model):
         self.last_seen_at = sa.func.utcnow()
 
     @classmethod
-    def for_user(cls, account: Account) -> Query[Self]:
+    def for_user(cls, account: Account, strict: bool = False) -> Query[Self]:
         """
         Return a query representing all active commentset memberships for a user.
 
@@ -77,16 +77,24 @@ class CommentsetMembership(ImmutableMembershipMixin, Model):
         it's a query on the class, it returns an instance of the query subclass from
         Flask-SQLAlchemy and Coaster. Relationships use the main class from SQLAlchemy
         which is missing pagination and the empty/notempty methods.
+
+        When `strict` is set, any relationship not eager-loaded here raises instead
+        of lazy-loading, turning an N+1 regression into a hard error in tests.
         """
+        options: list[sa_orm.interfaces.ORMOption] = [
+            # Parents are rendered per membership; batch-load them instead of
+            # three lazy loads per row
+            sa_orm.selectinload(cls.commentset).options(*Commentset.parent_options()),
+        ]
+        if strict:
+            options.append(sa_orm.raiseload('*'))
         return (
             cls.query.filter(
                 cls.member == account,
                 CommentsetMembership.is_active,
             )
             .join(Commentset)
-            .outerjoin(Project, Project.commentset_id == Commentset.id)
-            .outerjoin(Proposal, Proposal.commentset_id == Commentset.id)
-            .outerjoin(Update, Update.commentset_id == Commentset.id)
+            .options(*options)
             .order_by(
                 Commentset.last_comment_at.is_(None),
                 Commentset.last_comment_at.desc(),
@@ -94,12 +102,33 @@ class CommentsetMembership(ImmutableMembershipMixin, Model):
             )
         )
 
+    @classmethod
+    def new_comment_counts_for(cls, account: Account) -> dict[int, int]:
+        """
+        Return new comment counts for all the user's active subscriptions.
+
+        Unlike the :attr:`new_comment_count` column property, which runs one
+        correlated subquery per membership row, this aggregates server-side with a
+        single ``GROUP BY`` query. Commentsets with no new comments are absent from
+        the result.
+        """
+        return dict(
+            db.session.execute(
+                sa.select(Comment.commentset_id, sa.func.count(Comment.id))
+                .join(cls, cls.commentset_id == Comment.commentset_id)
+                .where(
+                    cls.member == account,
+                    cls.is_active,
+                    Comment.state.PUBLIC,  # type: ignore[has-type]  # FIXME
+                    Comment.created_at > cls.last_seen_at,
+                )
+                .group_by(Comment.commentset_id)
+            ).all()  # type: ignore[arg-type]
+        )
+
 
 # Tail imports
 from .comment import Comment, Commentset
-from .project import Project
-from .proposal import Proposal
-from .update import Update
 
 CommentsetMembership.new_comment_count = sa_orm.column_property(
     sa.select(sa.func.count(Comment.id))
@@ -107,5 +136,6 @@ CommentsetMembership.new_comment_count = sa_orm.column_property(
     .where(Comment.state.PUBLIC)  # type: ignore[has-type]  # FIXME
     .where(Comment.created_at > CommentsetMembership.last_seen_at)
     .correlate_except(Comment)
-    .scalar_subquery()
+    .scalar_subquery(),
+    deferred=True,
 )
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Collection
 from dataclasses import dataclass
 from datetime import date as date_type, datetime
+from functools import lru_cache
 from itertools import groupby
+from operator import attrgetter
 from typing import Self
 from uuid import UUID
 
@@ -32,9 +35,13 @@ from .sync_ticket import TicketParticipant
 
 __all__ = ['ContactExchange']
 
+#: The same few project UUIDs convert on every dashboard request; UUIDs are hashable
+#: and immutable, so memoize the base58 conversion (bounded to keep memory flat)
+_uuid_to_base58 = lru_cache(maxsize=4096)(uuid_to_base58)
+
 
 # Data classes for returning contacts grouped by project and date
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProjectId:
     """Holder for minimal :class:`~funnel.models.project.Project` information."""
 
@@ -45,7 +52,7 @@ class ProjectId:
     timezone: BaseTzInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class DateCountContacts:
     """Contacts per date of a Project's schedule."""
 
@@ -107,15 +114,20 @@ class ContactExchange(TimestampMixin, RoleMixin, Model):
     @classmethod
     def migrate_account(cls, old_account: Account, new_account: Account) -> None:
         """Migrate one account's data to another when merging accounts."""
-        ticket_participant_ids = {
-            ce.ticket_participant_id for ce in new_account.scanned_contacts
-        }
-        for ce in old_account.scanned_contacts:
-            if ce.ticket_participant_id not in ticket_participant_ids:
-                ce.account = new_account
-            else:
-                # Discard duplicate contact exchange
-                db.session.delete(ce)
+        # Discard duplicates (participants already scanned by the new account), then
+        # reassign the rest. Two bulk statements instead of one per scanned contact,
+        # keeping merge time independent of scan history size
+        cls.query.filter(
+            cls.account_id == old_account.id,
+            cls.ticket_participant_id.in_(
+                sa.select(cls.ticket_participant_id)
+                .where(cls.account_id == new_account.id)
+                .correlate(None)
+            ),
+        ).delete(synchronize_session=False)
+        cls.query.filter(cls.account_id == old_account.id).update(
+            {'account_id': new_account.id}, synchronize_session=False
+        )
 
     @classmethod
     def grouped_counts_for(
@@ -164,7 +176,7 @@ class ContactExchange(TimestampMixin, RoleMixin, Model):
                 sa.column('project_timezone'),
                 sa.column('scan_date'),
             )
-            .order_by(sa.text('scan_date DESC'))
+            .order_by(sa.text('project_id'), sa.text('scan_date DESC'))
         )
 
         # Issued SQL:
@@ -194,7 +206,7 @@ class ContactExchange(TimestampMixin, RoleMixin, Model):
         #     AND contact_exchange.archived IS false
         #   ) AS anon_1
         # GROUP BY project_id, project_uuid, project_title, project_timezone, scan_date
-        # ORDER BY scan_date DESC
+        # ORDER BY project_id, scan_date DESC
 
         # The query result has rows of:
         # (project_id, project_uuid, project_title, project_timezone, scan_date, count)
@@ -211,31 +223,71 @@ class ContactExchange(TimestampMixin, RoleMixin, Model):
         # We don't do it here, but this can easily be converted into a dictionary of
         # `{project: dates}` using `dict(result)`
 
-        return [
-            (
-                k,
-                [
-                    DateCountContacts(
-                        r.scan_date,
-                        r.count,  # type: ignore[arg-type]  # FIXME
-                        cls.contacts_for_project_and_date(
-                            account, k, r.scan_date, archived
-                        ),
-                    )
-                    for r in g
-                ],
-            )
-            for k, g in groupby(
-                query,
-                lambda row: ProjectId(
-                    id=row.project_id,
-                    uuid=row.project_uuid,
-                    uuid_b58=uuid_to_base58(row.project_uuid),
-                    title=row.project_title,
-                    timezone=timezone(row.project_timezone),
+        rows = query.all()
+
+        # Prefetch all matching contacts in a single query and bucket them in Python
+        # by project and local date, instead of returning one query per
+        # (project, date) group that issues a SELECT when rendered
+        tzinfo_by_project = {
+            row.project_id: timezone(row.project_timezone) for row in rows
+        }
+        contacts_by_date: defaultdict[tuple[int, date_type], list[ContactExchange]] = (
+            defaultdict(list)
+        )
+        contacts_query = (
+            cls.query.join(TicketParticipant)
+            .filter(cls.account == account)
+            .options(
+                # The dashboard renders each contact's participant avatar; load
+                # those accounts in one batch, and raise on any other relationship
+                # access instead of lazy-loading per row
+                sa_orm.contains_eager(cls.ticket_participant).selectinload(
+                    TicketParticipant.participant
                 ),
+                sa_orm.raiseload('*'),
+            )
+        )
+        if not archived:
+            contacts_query = contacts_query.filter(cls.archived.is_(False))
+        # Stream in batches rather than buffering the full history client-side;
+        # the aggregate `rows` above is already small (one row per project and date)
+        for contact in contacts_query.yield_per(1000):
+            project_id = contact.ticket_participant.project_id
+            tzinfo = tzinfo_by_project.get(project_id)
+            if tzinfo is not None:
+                contacts_by_date[
+                    project_id, contact.scanned_at.astimezone(tzinfo).date()
+                ].append(contact)
+
+        # Group on the integer project id rather than a per-row ProjectId dataclass,
+        # so the base58 conversion and dataclass construction happen once per project
+        # instead of once per row
+        result = []
+        for project_id, group in groupby(rows, key=attrgetter('project_id')):
+            grouped_rows = list(group)
+            first = grouped_rows[0]
+            result.append(
+                (
+                    ProjectId(
+                        id=project_id,
+                        uuid=first.project_uuid,
+                        uuid_b58=_uuid_to_base58(first.project_uuid),
+                        title=first.project_title,
+                        timezone=tzinfo_by_project[project_id],
+                    ),
+                    [
+                        DateCountContacts(
+                            r.scan_date,
+                            r.count,  # type: ignore[arg-type]  # FIXME
+                            contacts_by_date[project_id, r.scan_date],
+                        )
+                        for r in grouped_rows
+                    ],
+                )
             )
-        ]
+        # Most recently scanned projects first, as before the project_id sort key
+        result.sort(key=lambda item: item[1][0].date, reverse=True)
+        return result
 
     @classmethod
     def contacts_for_project_and_date(
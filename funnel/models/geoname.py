@@ -312,18 +312,18 @@ class GeoName(BaseNameMixin, GeonameModel):
         """Return geoname record (self!)."""
         return self
 
-    @property
-    def use_title(self) -> str:
-        """Return a recommended usable title (English-only)."""
-        usetitle = self.ascii_title or ''
-        if self.fclass == 'A' and self.fcode and self.fcode.startswith('PCL'):
+    @staticmethod
+    def get_use_title(ascii_title: str, fclass: str | None, fcode: str | None) -> str:
+        """Return a recommended usable title (English-only) for the given fields."""
+        usetitle = ascii_title
+        if fclass == 'A' and fcode and fcode.startswith('PCL'):
             if 'of the' in usetitle:
                 usetitle = usetitle.split('of the')[-1].strip()
             elif 'of The' in usetitle:
                 usetitle = usetitle.split('of The')[-1].strip()
             elif 'of' in usetitle:
                 usetitle = usetitle.split('of')[-1].strip()
-        elif self.fclass == 'A' and self.fcode == 'ADM1':
+        elif fclass == 'A' and fcode == 'ADM1':
             usetitle = (
                 usetitle.replace('State of', '')
                 .replace('Union Territory of', '')
@@ -331,6 +331,11 @@ class GeoName(BaseNameMixin, GeonameModel):
             )
         return usetitle
 
+    @property
+    def use_title(self) -> str:
+        """Return a recommended usable title (English-only)."""
+        return self.get_use_title(self.ascii_title or '', self.fclass, self.fcode)
+
     def make_name(self, reserved: Collection[str] = ()) -> None:
         """Create a unique name for this geoname record."""
         if self.ascii_title:
@@ -7,10 +7,12 @@ import re
 import warnings
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from datetime import datetime
 from textwrap import dedent
 from typing import Any, ClassVar, Self, TypeVar, get_type_hints
 
 from better_profanity import profanity
+from flask import g, has_request_context
 from furl import furl
 from markupsafe import Markup, escape as html_escape
 from sqlalchemy import event as sa_event
@@ -22,7 +24,7 @@ from sqlalchemy.ext.mutable import MutableComposite
 from sqlalchemy.orm import Mapped, composite
 from zxcvbn import zxcvbn
 
-from coaster.utils import DataclassFromType
+from coaster.utils import DataclassFromType, utcnow
 
 from .. import app
 from ..typing import T
@@ -43,6 +45,7 @@ __all__ = [
     'valid_account_name',
     'quote_autocomplete_like',
     'quote_autocomplete_tsquery',
+    'request_utcnow',
     'ImgeeFurl',
     'ImgeeType',
     'MarkdownCompositeBase',
@@ -51,92 +54,95 @@ __all__ = [
     'MarkdownCompositeInline',
 ]
 
-RESERVED_NAMES: set[str] = {
-    '_baseframe',
-    'about',
-    'account',
-    'admin',
-    'api',
-    'app',
-    'apps',
-    'auth',
-    'blog',
-    'boxoffice',
-    'brand',
-    'brands',
-    'by',
-    'calendar',
-    'client',
-    'clients',
-    'comments',
-    'confirm',
-    'contact',
-    'contacts',
-    'crew',
-    'dashboard',
-    'delete',
-    'edit',
-    'email',
-    'emails',
-    'embed',
-    'event',
-    'events',
-    'follow',
-    'followers',
-    'following',
-    'ftp',
-    'funnel',
-    'funnels',
-    'hacknight',
-    'hacknights',
-    'hgtv',
-    'imap',
-    'in',
-    'json',
-    'kharcha',
-    'login',
-    'logout',
-    'members',
-    'membership',
-    'new',
-    'news',
-    'notification',
-    'notifications',
-    'org',
-    'organisation',
-    'organisations',
-    'organization',
-    'organizations',
-    'orgs',
-    'pop',
-    'pop3',
-    'profile',
-    'profiles',
-    'project',
-    'projects',
-    'proposal',
-    'proposals',
-    'register',
-    'reset',
-    'search',
-    'siteadmin',
-    'smtp',
-    'sponsors',
-    'static',
-    'ticket',
-    'tickets',
-    'token',
-    'tokens',
-    'update',
-    'updates',
-    'venue',
-    'venues',
-    'video',
-    'videos',
-    'workshop',
-    'workshops',
-    'www',
-}
+#: All entries must be lowercase, as candidate names are lowercased for the lookup
+RESERVED_NAMES: frozenset[str] = frozenset(
+    {
+        '_baseframe',
+        'about',
+        'account',
+        'admin',
+        'api',
+        'app',
+        'apps',
+        'auth',
+        'blog',
+        'boxoffice',
+        'brand',
+        'brands',
+        'by',
+        'calendar',
+        'client',
+        'clients',
+        'comments',
+        'confirm',
+        'contact',
+        'contacts',
+        'crew',
+        'dashboard',
+        'delete',
+        'edit',
+        'email',
+        'emails',
+        'embed',
+        'event',
+        'events',
+        'follow',
+        'followers',
+        'following',
+        'ftp',
+        'funnel',
+        'funnels',
+        'hacknight',
+        'hacknights',
+        'hgtv',
+        'imap',
+        'in',
+        'json',
+        'kharcha',
+        'login',
+        'logout',
+        'members',
+        'membership',
+        'new',
+        'news',
+        'notification',
+        'notifications',
+        'org',
+        'organisation',
+        'organisations',
+        'organization',
+        'organizations',
+        'orgs',
+        'pop',
+        'pop3',
+        'profile',
+        'profiles',
+        'project',
+        'projects',
+        'proposal',
+        'proposals',
+        'register',
+        'reset',
+        'search',
+        'siteadmin',
+        'smtp',
+        'sponsors',
+        'static',
+        'ticket',
+        'tickets',
+        'token',
+        'tokens',
+        'update',
+        'updates',
+        'venue',
+        'venues',
+        'video',
+        'videos',
+        'workshop',
+        'workshops',
+        'www',
+    }
+)
 
 
 @dataclass(frozen=True)
@@ -218,6 +224,25 @@ with open(
 visual_field_delimiter = ' ¦ '
 
 
+def request_utcnow() -> datetime:
+    """
+    Return the current UTC timestamp, cached for the duration of the request.
+
+    Python-side conditional state predicates (past/live/upcoming and CfP open/expired)
+    are evaluated repeatedly while rendering project listings. Within a single request
+    they should all see the same instant, so the timestamp is computed once and stored
+    on ``g``. Outside a request context (background jobs, shell), a fresh timestamp is
+    returned on every call.
+    """
+    if has_request_context():
+        try:
+            return g._request_utcnow
+        except AttributeError:
+            now = g._request_utcnow = utcnow()
+            return now
+    return utcnow()
+
+
 def add_to_class(cls: type, name: str | None = None) -> Callable[[T], T]:
     """
     Add a new method to a class via a decorator. Takes an optional attribute name.
@@ -684,7 +709,13 @@ class MarkdownCompositeBase(MutableComposite):
     @text.setter
     def text(self, value: str | None) -> None:
         """Set the text value."""
-        self._text = None if value is None else str(value)
+        value = None if value is None else str(value)
+        # Skip the Markdown render and the change flag when the text is unchanged
+        # (common when edit forms resubmit all fields): re-rendering is O(len) and
+        # flagging the composite rewrites both columns and the search vector
+        if getattr(self, '_html', None) is not None and value == self._text:
+            return
+        self._text = value
         self._html = self.config.render(self._text)
         self.changed()
 
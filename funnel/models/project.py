@@ -53,7 +53,7 @@ from .helpers import (
     ImgeeType,
     IntTitle,
     MarkdownCompositeDocument,
-    add_search_trigger,
+    request_utcnow,
     valid_name,
     visual_field_delimiter,
 )
@@ -63,6 +63,10 @@ __all__ = ['ProjectRsvpStateEnum', 'Project', 'ProjectLocation', 'ProjectRedirec
 
 # MARK: Constants -------------------------------------------------------------
 
+#: Sentence-ending punctuation after which :attr:`Project.title_inline` will not
+#: suffix a colon
+_title_punctuation = frozenset('?!:;.,')
+
 
 class PROJECT_STATE(LabeledEnum):  # noqa: N801
     DRAFT = (1, NameTitle('draft', __("Draft")))
@@ -348,6 +352,16 @@ class Project(UuidMixin, BaseScopedNameMixin[int, Account], Model):
                 Project.instructions_html,
             ),
         ),
+        sa.Computed(
+            "setweight(to_tsvector('english', COALESCE(name, '')), 'A')"
+            " || setweight(to_tsvector('english', COALESCE(title, '')), 'A')"
+            " || setweight(to_tsvector('english', COALESCE(description_text, '')),"
+            " 'B')"
+            " || setweight(to_tsvector('english', COALESCE(instructions_text, '')),"
+            " 'B')"
+            " || setweight(to_tsvector('english', COALESCE(location, '')), 'C')",
+            persisted=True,
+        ),
         nullable=False,
         deferred=True,
     )
@@ -470,6 +484,8 @@ class Project(UuidMixin, BaseScopedNameMixin[int, Account], Model):
         schedule_start_at: Mapped[datetime | None]
         next_session_at: Mapped[datetime | None]
         schedule_end_at: Mapped[datetime | None]
+        has_proposals: Mapped[bool]
+        has_sessions: Mapped[bool]
         # This relationship is added by add_primary_relationship in models/venue.py
         primary_venue: Mapped[Venue | None] = relationship()
 
@@ -614,7 +630,8 @@ class Project(UuidMixin, BaseScopedNameMixin[int, Account], Model):
     state.add_conditional_state(
         'PAST',
         state.PUBLISHED,
-        lambda project: project.end_at is not None and utcnow() >= project.end_at,
+        lambda project: project.end_at is not None
+        and request_utcnow() >= project.end_at,
         lambda project: sa.func.utcnow() >= project.end_at,
         label=('past', __("Past")),
     )
@@ -624,7 +641,7 @@ class Project(UuidMixin, BaseScopedNameMixin[int, Account], Model):
         lambda project: (
             project.start_at is not None
             and project.end_at is not None
-            and project.start_at <= utcnow() < project.end_at
+            and project.start_at <= request_utcnow() < project.end_at
         ),
         lambda project: sa.and_(
             project.start_at <= sa.func.utcnow(),
@@ -635,7 +652,8 @@ class Project(UuidMixin, BaseScopedNameMixin[int, Account], Model):
     state.add_conditional_state(
         'UPCOMING',
         state.PUBLISHED,
-        lambda project: project.start_at is not None and utcnow() < project.start_at,
+        lambda project: project.start_at is not None
+        and request_utcnow() < project.start_at,
         lambda project: sa.func.utcnow() < project.start_at,
         label=('upcoming', __("Upcoming")),
     )
@@ -650,14 +668,14 @@ class Project(UuidMixin, BaseScopedNameMixin[int, Account], Model):
     cfp_state.add_conditional_state(
         'HAS_PROPOSALS',
         cfp_state.ANY,
-        lambda project: db.session.query(project.proposals.exists()).scalar(),
+        lambda project: project.has_proposals,
         lambda project: project.proposals.exists(),
         label=('has_proposals', __("Has submissions")),
     )
     cfp_state.add_conditional_state(
         'HAS_SESSIONS',
         cfp_state.ANY,
-        lambda project: db.session.query(project.sessions.exists()).scalar(),
+        lambda project: project.has_sessions,
         lambda project: project.sessions.exists(),
         label=('has_sessions', __("Has sessions")),
     )
@@ -673,7 +691,8 @@ class Project(UuidMixin, BaseScopedNameMixin[int, Account], Model):
     cfp_state.add_conditional_state(
         'OPEN',
         cfp_state.PUBLIC,
-        lambda project: project.cfp_end_at is None or (utcnow() < project.cfp_end_at),
+        lambda project: project.cfp_end_at is None
+        or (request_utcnow() < project.cfp_end_at),
         lambda project: sa.or_(
             project.cfp_end_at.is_(None), sa.func.utcnow() < project.cfp_end_at
         ),
@@ -683,7 +702,7 @@ class Project(UuidMixin, BaseScopedNameMixin[int, Account], Model):
         'EXPIRED',
         cfp_state.PUBLIC,
         lambda project: project.cfp_end_at is not None
-        and utcnow() >= project.cfp_end_at,
+        and request_utcnow() >= project.cfp_end_at,
         lambda project: sa.and_(
             project.cfp_end_at.is_not(None), sa.func.utcnow() >= project.cfp_end_at
         ),
@@ -814,11 +833,7 @@ class Project(UuidMixin, BaseScopedNameMixin[int, Account], Model):
     def title_inline(self) -> str:
         """Suffix a colon if the title does not end in ASCII sentence punctuation."""
         # pylint: disable=unsubscriptable-object
-        if (
-            self.title
-            and self.tagline
-            and self.title[-1] not in ('?', '!', ':', ';', '.', ',')
-        ):
+        if self.title and self.tagline and self.title[-1] not in _title_punctuation:
             return self.title + ':'
         return self.title
 
@@ -886,36 +901,31 @@ class Project(UuidMixin, BaseScopedNameMixin[int, Account], Model):
         4. If multi-day event across years:
             > 30 Dec 2018–02 Jan 2019, Bangalore
         """
-        # FIXME: Replace strftime with Babel formatting
         start_at = self.start_at_localized
         end_at = self.end_at_localized
         if start_at is not None and end_at is not None:
             schedule_start_at_date = start_at.date()
             schedule_end_at_date = end_at.date()
-            daterange_format = '{start_date}–{end_date} {year}'
+            end_date = (
+                f'{format_date(schedule_end_at_date, "dd MMM")}'
+                f' {schedule_end_at_date.year}'
+            )
             if schedule_start_at_date == schedule_end_at_date:
-                # if both dates are same, in case of single day project
-                strf_date = ''
-                daterange_format = '{end_date} {year}'
-            elif schedule_start_at_date.year != schedule_end_at_date.year:
-                # if the start date and end dates are in different years,
-                strf_date = '%d %b %Y'
-            elif schedule_start_at_date.month != schedule_end_at_date.month:
-                # If multi-day event across months
-                strf_date = '%d %b'
-            elif schedule_start_at_date.month == schedule_end_at_date.month:
-                # If multi-day event in same month
-                strf_date = '%d'
+                # Single day event: render the end date alone
+                daterange = end_date
             else:
-                raise ValueError(
-                    "This should not happen: unknown date range"
-                    f" {schedule_start_at_date}–{schedule_end_at_date}"
+                if schedule_start_at_date.year != schedule_end_at_date.year:
+                    # Multi-day event across years
+                    start_format = 'dd MMM y'
+                elif schedule_start_at_date.month != schedule_end_at_date.month:
+                    # Multi-day event across months
+                    start_format = 'dd MMM'
+                else:
+                    # Multi-day event in same month
+                    start_format = 'dd'
+                daterange = (
+                    f'{format_date(schedule_start_at_date, start_format)}–{end_date}'
                 )
-            daterange = daterange_format.format(
-                start_date=schedule_start_at_date.strftime(strf_date),
-                end_date=schedule_end_at_date.strftime('%d %b'),
-                year=schedule_end_at_date.year,
-            )
         else:
             daterange = ''
         return ', '.join([_f for _f in [daterange, self.location] if _f])
@@ -1037,7 +1047,8 @@ class Project(UuidMixin, BaseScopedNameMixin[int, Account], Model):
 
     def is_safe_to_delete(self) -> bool:
         """Return True if project has no proposals."""
-        return self.proposals.count() == 0
+        # Use EXISTS instead of counting: Postgres stops at the first matching row
+        return not db.session.query(self.proposals.exists()).scalar()
 
     @property
     def proposals_all(self) -> Query[Proposal]:
@@ -1492,6 +1503,10 @@ class Project(UuidMixin, BaseScopedNameMixin[int, Account], Model):
             cls.query.join(Account, Project.account)
             .outerjoin(Venue)
             .filter(cls.state.PUBLISHED, Account.is_verified.is_(True))
+            # The account is already joined for the is_verified filter; populate the
+            # relationship from that join so project listings don't lazy-load the
+            # account per row for titles and URLs
+            .options(sa_orm.contains_eager(cls.account))
         )
 
     @classmethod
@@ -1516,19 +1531,26 @@ class Project(UuidMixin, BaseScopedNameMixin[int, Account], Model):
     @classmethod
     def migrate_account(cls, old_account: Account, new_account: Account) -> None:
         """Migrate from one account to another when merging users."""
-        names = {project.name for project in new_account.projects}
-        for project in old_account.projects:
-            if project.name in names:
-                app.logger.warning(
-                    "Project %r had a conflicting name in account migration,"
-                    " so renaming by adding adding random value to name",
-                    project,
-                )
-                project.name += '-' + buid()
-            project.account = new_account
-
-
-add_search_trigger(Project, 'search_vector')
+        # Rename projects whose names clash with a name in the new account, then
+        # reassign all of the old account's projects. Two bulk statements instead of
+        # one per project, keeping merge time independent of project count
+        renamed = cls.query.filter(
+            cls.account_id == old_account.id,
+            cls.name.in_(
+                sa.select(cls.name)
+                .where(cls.account_id == new_account.id)
+                .correlate(None)
+            ),
+        ).update({'name': cls.name + '-' + buid()}, synchronize_session=False)
+        if renamed:
+            app.logger.warning(
+                "%d project(s) had conflicting names in account migration,"
+                " so renaming by adding random value to name",
+                renamed,
+            )
+        cls.query.filter(cls.account_id == old_account.id).update(
+            {'account_id': new_account.id}, synchronize_session=False
+        )
 
 
 class ProjectRedirect(TimestampMixin, Model):
@@ -1668,6 +1690,19 @@ Project._has_featured_proposals = sa_orm.column_property(
 )
 # pylint: enable=protected-access
 
+# Whether the project has any proposals or sessions, backing the HAS_PROPOSALS and
+# HAS_SESSIONS conditional states. Deferred by default, but list queries can undefer
+# these to load the flags in the same SELECT as the project rows instead of issuing
+# a per-project EXISTS query on first state check
+Project.has_proposals = sa_orm.column_property(
+    sa.exists().where(Proposal.project_id == Project.id).correlate_except(Proposal),
+    deferred=True,
+)
+Project.has_sessions = sa_orm.column_property(
+    sa.exists().where(Session.project_id == Project.id).correlate_except(Session),
+    deferred=True,
+)
+
 
 # Project schedule column expressions. Guide:
 # https://docs.sqlalchemy.org/en/13/orm/mapped_sql_expr.html#using-column-property
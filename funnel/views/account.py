@@ -203,7 +203,7 @@ def avatar_color_code(obj: Account) -> int:
     return total % avatar_color_count
 
 
-@Account.features('not_likely_throwaway', property=True)
+@Account.features('not_likely_throwaway', cached_property=True)
 def user_not_likely_throwaway(obj: Account) -> bool:
     """
     Confirm the user is not likely to be a throwaway account.
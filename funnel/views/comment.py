@@ -74,7 +74,9 @@ def comment_url(obj: Comment) -> str | None:
 
 @Commentset.views('json_comments')
 def commentset_json(obj: Commentset) -> list[RoleAccessProxy[Comment]]:
-    toplevel_comments = obj.toplevel_comments.order_by(Comment.created_at.desc())
+    toplevel_comments = obj.toplevel_comments.order_by(
+        Comment.created_at.desc()
+    ).options(*Comment.list_options())
     return [
         comment.current_access(datasets=('json', 'related'))
         for comment in toplevel_comments
@@ -117,6 +119,11 @@ class AllCommentsView(ClassView):
     def view(self, page: int = 1, per_page: int = 20) -> ReturnRenderWith:
         query = CommentsetMembership.for_user(current_auth.user)
         pagination = query.paginate(page=page, per_page=per_page, max_per_page=100)
+        # One GROUP BY query for all subscriptions, instead of a correlated
+        # subquery per rendered row. Commentsets with no new comments are absent
+        new_comment_counts = CommentsetMembership.new_comment_counts_for(
+            current_auth.user
+        )
         return {
             'commentset_memberships': [
                 {
@@ -126,7 +133,7 @@ class AllCommentsView(ClassView):
                     ),
                     'commentset_url': cm.commentset.url_for(),
                     'last_seen_at': cm.last_seen_at,
-                    'new_comment_count': cm.new_comment_count,
+                    'new_comment_count': new_comment_counts.get(cm.commentset_id, 0),
                     'last_comment_at': cm.commentset.last_comment_at,
                     'last_comment': cm.commentset.views.last_comment,
                 }
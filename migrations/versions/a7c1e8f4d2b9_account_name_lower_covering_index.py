@@ -0,0 +1,47 @@
+"""Account name lower covering index.
+
+Revision ID: a7c1e8f4d2b9
+Revises: f2b8d4a6c3e7
+Create Date: 2026-08-31 15:24:17.508213
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'a7c1e8f4d2b9'
+down_revision = 'f2b8d4a6c3e7'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade(engine_name: str = '') -> None:
+    # Do not modify. Edit `upgrade_` instead
+    globals().get(f'upgrade_{engine_name}', lambda: None)()
+
+
+def downgrade(engine_name: str = '') -> None:
+    # Do not modify. Edit `downgrade_` instead
+    globals().get(f'downgrade_{engine_name}', lambda: None)()
+
+
+def upgrade_() -> None:
+    op.drop_index('ix_account_name_lower', table_name='account')
+    op.create_index(
+        'ix_account_name_lower',
+        'account',
+        [sa.text('lower(name) varchar_pattern_ops')],
+        unique=True,
+        postgresql_include=['type'],
+    )
+
+
+def downgrade_() -> None:
+    op.drop_index('ix_account_name_lower', table_name='account')
+    op.create_index(
+        'ix_account_name_lower',
+        'account',
+        [sa.text('lower(name) varchar_pattern_ops')],
+        unique=True,
+    )
@@ -0,0 +1,88 @@
+"""Comment search_vector generated column.
+
+Revision ID: c9c2c4dd8db6
+Revises: b2ff82e10160
+Create Date: 2026-08-31 12:24:08.151374
+
+"""
+
+from textwrap import dedent
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy_utils import TSVectorType
+
+# revision identifiers, used by Alembic.
+revision = 'c9c2c4dd8db6'
+down_revision = 'b2ff82e10160'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade(engine_name: str = '') -> None:
+    # Do not modify. Edit `upgrade_` instead
+    globals().get(f'upgrade_{engine_name}', lambda: None)()
+
+
+def downgrade(engine_name: str = '') -> None:
+    # Do not modify. Edit `downgrade_` instead
+    globals().get(f'downgrade_{engine_name}', lambda: None)()
+
+
+def upgrade_() -> None:
+    op.execute(sa.text('DROP TRIGGER comment_search_vector_trigger ON comment'))
+    op.execute(sa.text('DROP FUNCTION comment_search_vector_update()'))
+    op.drop_index('ix_comment_search_vector', table_name='comment')
+    op.drop_column('comment', 'search_vector')
+    op.add_column(
+        'comment',
+        sa.Column(
+            'search_vector',
+            TSVectorType(),
+            sa.Computed(
+                "setweight(to_tsvector('english', COALESCE(message_text, '')), 'A')",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        'ix_comment_search_vector',
+        'comment',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade_() -> None:
+    op.drop_index('ix_comment_search_vector', table_name='comment')
+    op.drop_column('comment', 'search_vector')
+    op.add_column('comment', sa.Column('search_vector', TSVectorType(), nullable=True))
+    op.execute(
+        sa.text(
+            dedent(
+                '''
+        UPDATE comment SET search_vector = setweight(to_tsvector('english', COALESCE(message_text, '')), 'A');
+
+        CREATE FUNCTION comment_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := setweight(to_tsvector('english', COALESCE(NEW.message_text, '')), 'A');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER comment_search_vector_trigger BEFORE INSERT OR UPDATE ON comment
+        FOR EACH ROW EXECUTE PROCEDURE comment_search_vector_update();
+        '''
+            )
+        )
+    )
+    op.alter_column('comment', 'search_vector', nullable=False)
+    op.create_index(
+        'ix_comment_search_vector',
+        'comment',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
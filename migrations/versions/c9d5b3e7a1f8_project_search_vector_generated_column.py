@@ -0,0 +1,97 @@
+"""Project search vector as generated column.
+
+Revision ID: c9d5b3e7a1f8
+Revises: a7c1e8f4d2b9
+Create Date: 2026-08-31 16:10:42.271854
+
+"""
+
+from textwrap import dedent
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy_utils import TSVectorType
+
+# revision identifiers, used by Alembic.
+revision = 'c9d5b3e7a1f8'
+down_revision = 'a7c1e8f4d2b9'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+search_vector_expr = (
+    "setweight(to_tsvector('english', COALESCE({p}name, '')), 'A')"
+    " || setweight(to_tsvector('english', COALESCE({p}title, '')), 'A')"
+    " || setweight(to_tsvector('english', COALESCE({p}description_text, '')), 'B')"
+    " || setweight(to_tsvector('english', COALESCE({p}instructions_text, '')), 'B')"
+    " || setweight(to_tsvector('english', COALESCE({p}location, '')), 'C')"
+)
+
+
+def upgrade(engine_name: str = '') -> None:
+    # Do not modify. Edit `upgrade_` instead
+    globals().get(f'upgrade_{engine_name}', lambda: None)()
+
+
+def downgrade(engine_name: str = '') -> None:
+    # Do not modify. Edit `downgrade_` instead
+    globals().get(f'downgrade_{engine_name}', lambda: None)()
+
+
+def upgrade_() -> None:
+    op.execute(sa.text('DROP TRIGGER project_search_vector_trigger ON project'))
+    op.execute(sa.text('DROP FUNCTION project_search_vector_update()'))
+    op.drop_index('ix_project_search_vector', table_name='project')
+    op.drop_column('project', 'search_vector')
+    op.add_column(
+        'project',
+        sa.Column(
+            'search_vector',
+            TSVectorType(),
+            sa.Computed(search_vector_expr.format(p=''), persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        'ix_project_search_vector',
+        'project',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade_() -> None:
+    op.drop_index('ix_project_search_vector', table_name='project')
+    op.drop_column('project', 'search_vector')
+    op.add_column('project', sa.Column('search_vector', TSVectorType(), nullable=True))
+    op.execute(
+        sa.text(
+            'UPDATE project SET search_vector ='  # noqa: S608
+            f' {search_vector_expr.format(p="")}'
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                f'''
+        CREATE FUNCTION project_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {search_vector_expr.format(p='NEW.')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER project_search_vector_trigger BEFORE INSERT OR UPDATE
+        ON project FOR EACH ROW EXECUTE PROCEDURE project_search_vector_update();
+        '''
+            )
+        )
+    )
+    op.alter_column('project', 'search_vector', nullable=False)
+    op.create_index(
+        'ix_project_search_vector',
+        'project',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
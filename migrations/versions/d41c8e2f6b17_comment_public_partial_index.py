@@ -0,0 +1,40 @@
+"""Comment public partial index.
+
+Revision ID: d41c8e2f6b17
+Revises: c9c2c4dd8db6
+Create Date: 2026-08-31 12:52:41.933815
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'd41c8e2f6b17'
+down_revision = 'c9c2c4dd8db6'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade(engine_name: str = '') -> None:
+    # Do not modify. Edit `upgrade_` instead
+    globals().get(f'upgrade_{engine_name}', lambda: None)()
+
+
+def downgrade(engine_name: str = '') -> None:
+    # Do not modify. Edit `downgrade_` instead
+    globals().get(f'downgrade_{engine_name}', lambda: None)()
+
+
+def upgrade_() -> None:
+    op.create_index(
+        'ix_comment_commentset_public_created',
+        'comment',
+        ['commentset_id', 'created_at'],
+        unique=False,
+        postgresql_where=sa.text('state IN (1, 6)'),
+    )
+
+
+def downgrade_() -> None:
+    op.drop_index('ix_comment_commentset_public_created', table_name='comment')
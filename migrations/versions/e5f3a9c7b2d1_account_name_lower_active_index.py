@@ -0,0 +1,40 @@
+"""Account name lower active partial index.
+
+Revision ID: e5f3a9c7b2d1
+Revises: d41c8e2f6b17
+Create Date: 2026-08-31 14:21:05.412878
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'e5f3a9c7b2d1'
+down_revision = 'd41c8e2f6b17'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade(engine_name: str = '') -> None:
+    # Do not modify. Edit `upgrade_` instead
+    globals().get(f'upgrade_{engine_name}', lambda: None)()
+
+
+def downgrade(engine_name: str = '') -> None:
+    # Do not modify. Edit `downgrade_` instead
+    globals().get(f'downgrade_{engine_name}', lambda: None)()
+
+
+def upgrade_() -> None:
+    op.create_index(
+        'ix_account_name_lower_active',
+        'account',
+        [sa.text('lower(name) varchar_pattern_ops')],
+        unique=False,
+        postgresql_where=sa.text('state = 1'),
+    )
+
+
+def downgrade_() -> None:
+    op.drop_index('ix_account_name_lower_active', table_name='account')
@@ -0,0 +1,107 @@
+"""Account search and name vectors as generated columns.
+
+Revision ID: f2b8d4a6c3e7
+Revises: e5f3a9c7b2d1
+Create Date: 2026-08-31 15:02:33.812945
+
+"""
+
+from textwrap import dedent
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy_utils import TSVectorType
+
+# revision identifiers, used by Alembic.
+revision = 'f2b8d4a6c3e7'
+down_revision = 'e5f3a9c7b2d1'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+search_vector_expr = (
+    "setweight(to_tsvector('english', COALESCE({p}title, '')), 'A')"
+    " || setweight(to_tsvector('english', COALESCE({p}name, '')), 'A')"
+    " || setweight(to_tsvector('english', COALESCE({p}tagline, '')), 'B')"
+    " || setweight(to_tsvector('english', COALESCE({p}description_text, '')), 'B')"
+)
+name_vector_expr = (
+    "to_tsvector('simple', COALESCE({p}title, ''))"
+    " || to_tsvector('simple', COALESCE({p}name, ''))"
+)
+
+
+def upgrade(engine_name: str = '') -> None:
+    # Do not modify. Edit `upgrade_` instead
+    globals().get(f'upgrade_{engine_name}', lambda: None)()
+
+
+def downgrade(engine_name: str = '') -> None:
+    # Do not modify. Edit `downgrade_` instead
+    globals().get(f'downgrade_{engine_name}', lambda: None)()
+
+
+def upgrade_() -> None:
+    for column_name, expr in [
+        ('search_vector', search_vector_expr),
+        ('name_vector', name_vector_expr),
+    ]:
+        op.execute(sa.text(f'DROP TRIGGER account_{column_name}_trigger ON account'))
+        op.execute(sa.text(f'DROP FUNCTION account_{column_name}_update()'))
+        op.drop_index(f'ix_account_{column_name}', table_name='account')
+        op.drop_column('account', column_name)
+        op.add_column(
+            'account',
+            sa.Column(
+                column_name,
+                TSVectorType(),
+                sa.Computed(expr.format(p=''), persisted=True),
+                nullable=False,
+            ),
+        )
+        op.create_index(
+            f'ix_account_{column_name}',
+            'account',
+            [column_name],
+            unique=False,
+            postgresql_using='gin',
+        )
+
+
+def downgrade_() -> None:
+    for column_name, expr in [
+        ('name_vector', name_vector_expr),
+        ('search_vector', search_vector_expr),
+    ]:
+        op.drop_index(f'ix_account_{column_name}', table_name='account')
+        op.drop_column('account', column_name)
+        op.add_column('account', sa.Column(column_name, TSVectorType(), nullable=True))
+        op.execute(
+            sa.text(
+                f'UPDATE account SET {column_name} = {expr.format(p="")}'  # noqa: S608
+            )
+        )
+        op.execute(
+            sa.text(
+                dedent(
+                    f'''
+            CREATE FUNCTION account_{column_name}_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.{column_name} := {expr.format(p='NEW.')};
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql;
+
+            CREATE TRIGGER account_{column_name}_trigger BEFORE INSERT OR UPDATE
+            ON account FOR EACH ROW EXECUTE PROCEDURE account_{column_name}_update();
+            '''
+                )
+            )
+        )
+        op.alter_column('account', column_name, nullable=False)
+        op.create_index(
+            f'ix_account_{column_name}',
+            'account',
+            [column_name],
+            unique=False,
+            postgresql_using='gin',
+        )
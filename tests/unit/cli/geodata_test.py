@@ -0,0 +1,63 @@
+"""Tests for the geonames data processor's row parsing and filtering."""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from funnel.cli import geodata
+
+
+def test_parse_moddate() -> None:
+    """The fixed-format fast path and the strptime fallback parse identically."""
+    assert geodata.parse_moddate('2010-08-31') == date(2010, 8, 31)
+    # Zero-padded components
+    assert geodata.parse_moddate('2010-01-02') == date(2010, 1, 2)
+    # Unpadded dates miss the fixed slice offsets and fall back to strptime
+    assert geodata.parse_moddate('2010-1-2') == date(2010, 1, 2)
+    with pytest.raises(ValueError, match='does not match format'):
+        geodata.parse_moddate('31-08-2010')
+
+
+def test_geoname_filter() -> None:
+    """Populated places are filtered on population; other classes on feature code."""
+    # A populated place above the threshold is kept, with its feature weight and
+    # population as sort key components
+    assert geodata.geoname_filter('P', 'PPL', '1000000') == (9, 1000000)
+    assert geodata.geoname_filter('P', 'PPL', '15000') == (9, 15000)
+    # Below the population threshold
+    assert geodata.geoname_filter('P', 'PPL', '14999') is None
+    # A population of 0 means data wasn't available; the place is kept
+    assert geodata.geoname_filter('P', 'PPL', '0') == (9, 0)
+    # A missing population is skipped for populated places
+    assert geodata.geoname_filter('P', 'PPL', '') is None
+    # Administrative divisions load regardless of population
+    assert geodata.geoname_filter('A', 'ADM1', '') == (16, 0)
+    assert geodata.geoname_filter('L', 'CONT', '0') == (22, 0)
+    # Feature codes not in the load table are skipped
+    assert geodata.geoname_filter('S', 'PPL', '100000') is None
+    assert geodata.geoname_filter('P', 'ZZZZ', '100000') is None
+
+
+def test_parse_coordinate() -> None:
+    """A coordinate of 0 is a valid location and is not collapsed to None."""
+    assert geodata.parse_coordinate('12.97194') == Decimal('12.97194')
+    assert geodata.parse_coordinate('-0.1275') == Decimal('-0.1275')
+    assert geodata.parse_coordinate('0') == Decimal('0')
+    assert geodata.parse_coordinate('0.0') == Decimal('0.0')
+    assert geodata.parse_coordinate('') is None
+
+
+def test_copy_escape() -> None:
+    """Values are escaped for PostgreSQL COPY text format."""
+    assert geodata.copy_escape(None) == r'\N'
+    assert geodata.copy_escape('plain') == 'plain'
+    assert geodata.copy_escape(0) == '0'
+    assert geodata.copy_escape('tab\there') == 'tab\\there'
+    assert geodata.copy_escape('new\nline') == 'new\\nline'
+    assert geodata.copy_escape('carriage\rreturn') == 'carriage\\rreturn'
+    # The escape character itself must be escaped first
+    assert geodata.copy_escape('back\\slash') == 'back\\\\slash'
+    assert geodata.copy_escape('\\t') == '\\\\t'
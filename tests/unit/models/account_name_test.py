@@ -151,6 +151,37 @@ def test_name_transfer(
     assert user_rincewind.username is None
 
 
+def test_name_is_normalized_client_side(
+    db_session: scoped_session, org_ankhmorpork: models.Organization
+) -> None:
+    """name_is folds case and hyphens in the parameter, not in the SQL."""
+    db_session.commit()
+    for candidate in ('ankh_morpork', 'Ankh_Morpork', 'ankh-morpork', 'ANKH-MORPORK'):
+        assert org_ankhmorpork.name_is(candidate)
+        assert (
+            models.Account.query.filter(models.Account.name_is(candidate)).one()
+            == org_ankhmorpork
+        )
+    # The comparison value is a plain pre-normalized bound constant, so the query
+    # matches the lower(name) functional index directly
+    expr = models.Account.name_is('Ankh-Morpork')
+    assert expr.right.value == 'ankh_morpork'  # type: ignore[attr-defined]
+
+
+def test_name_in(
+    db_session: scoped_session,
+    user_rincewind: models.User,
+    org_ankhmorpork: models.Organization,
+) -> None:
+    """name_in matches candidates case-insensitively, folding hyphens."""
+    db_session.commit()
+    accounts = models.Account.query.filter(
+        models.Account.name_in(['RinceWind', 'Ankh-Morpork', 'wizzard'])
+    ).all()
+    assert set(accounts) == {user_rincewind, org_ankhmorpork}
+    assert models.Account.query.filter(models.Account.name_in([])).all() == []
+
+
 def test_urlname(user_twoflower: models.User, user_rincewind: models.User) -> None:
     """An Account has a URL name even if there's no name."""
     assert user_twoflower.name is None
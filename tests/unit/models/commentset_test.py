@@ -60,7 +60,7 @@ def test_comment_delete_does_not_cascade_to_commentset(
     assert commentset is not None
     assert commentset.id == commentset_id
     assert commentset == project_expo2010.commentset
-    assert list(commentset.comments) == [comment1]
+    assert db_session.scalars(commentset.comments.select()).all() == [comment1]
 
 
 def test_commentset_cannot_be_deleted(db_session, project_expo2010) -> None:
@@ -97,3 +97,58 @@ def test_commentset_delete_cascades_to_comments(
     assert commentset is None
     assert comment1_reload is None
     assert comment2_reload is None
+
+
+def test_for_user_strict_covers_listing_accesses(
+    db_session: scoped_session,
+    project_expo2010: models.Project,
+    user_rincewind: models.User,
+    comment1: models.Comment,
+) -> None:
+    """The subscription listing's eager loads cover everything the view renders."""
+    project_expo2010.commentset.add_subscriber(
+        actor=user_rincewind, member=user_rincewind
+    )
+    db_session.commit()
+    memberships = models.CommentsetMembership.for_user(
+        user_rincewind, strict=True
+    ).all()
+    assert len(memberships) == 1
+    # With strict's raiseload in effect, these accesses must be satisfied by the
+    # query's own eager loads or a lazy load will raise
+    membership = memberships[0]
+    assert membership.commentset.parent_type == 'project'
+    assert membership.commentset.parent == project_expo2010
+    assert membership.commentset.last_comment_at is not None
+    assert membership.last_seen_at is not None
+
+
+def test_public_replies_exclude_removed(
+    db_session: scoped_session,
+    project_expo2010: models.Project,
+    user_rincewind: models.User,
+    comment1: models.Comment,
+) -> None:
+    """Replies are filtered by state on the reply side of the join, not the parent."""
+    public_reply = models.Comment(
+        posted_by=user_rincewind,
+        commentset=project_expo2010.commentset,
+        message="Public reply",
+        in_reply_to=comment1,
+    )
+    spam_reply = models.Comment(
+        posted_by=user_rincewind,
+        commentset=project_expo2010.commentset,
+        message="Spam reply",
+        in_reply_to=comment1,
+    )
+    db_session.add_all([public_reply, spam_reply])
+    db_session.commit()
+    spam_reply.mark_spam()
+    db_session.commit()
+    assert comment1.public_replies == [public_reply]
+
+    # A deleted parent is preserved for its replies, which must still be listed
+    comment1.delete()
+    db_session.commit()
+    assert comment1.public_replies == [public_reply]
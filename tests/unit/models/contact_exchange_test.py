@@ -0,0 +1,110 @@
+"""Tests for contact exchange grouping."""
+
+# pylint: disable=redefined-outer-name
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pytest
+from pytz import utc
+
+from funnel import models
+
+from ...conftest import scoped_session
+
+
+@pytest.fixture
+def scanned_contacts(
+    db_session: scoped_session,
+    user_rincewind: models.User,
+    project_expo2010: models.Project,
+    project_ai1: models.Project,
+) -> dict[str, models.ContactExchange]:
+    """Contacts scanned by Rincewind across two projects on interleaved dates."""
+    contacts: dict[str, models.ContactExchange] = {}
+    scans = {
+        'expo_day1_a': (project_expo2010, datetime(2010, 8, 1, 10, tzinfo=utc)),
+        'expo_day1_b': (project_expo2010, datetime(2010, 8, 1, 11, tzinfo=utc)),
+        'expo_day3': (project_expo2010, datetime(2010, 8, 3, 10, tzinfo=utc)),
+        'ai_day2': (project_ai1, datetime(2010, 8, 2, 10, tzinfo=utc)),
+        'ai_day4': (project_ai1, datetime(2010, 8, 4, 9, tzinfo=utc)),
+    }
+    for name, (project, scanned_at) in scans.items():
+        ticket_participant = models.TicketParticipant(project=project, fullname=name)
+        db_session.add(ticket_participant)
+        contacts[name] = models.ContactExchange(
+            account=user_rincewind,
+            ticket_participant=ticket_participant,
+            scanned_at=scanned_at,
+        )
+        db_session.add(contacts[name])
+    db_session.commit()
+    return contacts
+
+
+def test_grouped_counts_for(
+    db_session: scoped_session,
+    user_rincewind: models.User,
+    project_expo2010: models.Project,
+    project_ai1: models.Project,
+    scanned_contacts: dict[str, models.ContactExchange],
+) -> None:
+    """Contacts are grouped by project and date, most recent scans first."""
+    result = models.ContactExchange.grouped_counts_for(user_rincewind)
+
+    # Projects are ordered by their most recent scan date, newest first
+    assert [project.id for project, _dates in result] == [
+        project_ai1.id,
+        project_expo2010.id,
+    ]
+
+    ai_project, ai_dates = result[0]
+    assert ai_project.uuid == project_ai1.uuid
+    assert ai_project.title == project_ai1.title
+    assert ai_project.timezone == project_ai1.timezone
+    # Dates within a project are in descending order, with per-date counts and
+    # the matching contacts bucketed into each date
+    assert [(d.date, d.count) for d in ai_dates] == [
+        (date(2010, 8, 4), 1),
+        (date(2010, 8, 2), 1),
+    ]
+    assert list(ai_dates[0].contacts) == [scanned_contacts['ai_day4']]
+    assert list(ai_dates[1].contacts) == [scanned_contacts['ai_day2']]
+
+    expo_project, expo_dates = result[1]
+    assert expo_project.uuid == project_expo2010.uuid
+    assert [(d.date, d.count) for d in expo_dates] == [
+        (date(2010, 8, 3), 1),
+        (date(2010, 8, 1), 2),
+    ]
+    assert list(expo_dates[0].contacts) == [scanned_contacts['expo_day3']]
+    assert set(expo_dates[1].contacts) == {
+        scanned_contacts['expo_day1_a'],
+        scanned_contacts['expo_day1_b'],
+    }
+
+
+def test_grouped_counts_for_skips_archived(
+    db_session: scoped_session,
+    user_rincewind: models.User,
+    scanned_contacts: dict[str, models.ContactExchange],
+) -> None:
+    """Archived contacts are excluded unless explicitly requested."""
+    scanned_contacts['ai_day4'].archived = True
+    db_session.commit()
+
+    result = models.ContactExchange.grouped_counts_for(user_rincewind)
+    assert [d.date for _project, dates in result for d in dates] == [
+        date(2010, 8, 3),
+        date(2010, 8, 1),
+        date(2010, 8, 2),
+    ]
+
+    result = models.ContactExchange.grouped_counts_for(user_rincewind, archived=True)
+    assert [d.date for _project, dates in result for d in dates] == [
+        date(2010, 8, 4),
+        date(2010, 8, 2),
+        date(2010, 8, 3),
+        date(2010, 8, 1),
+    ]